@@ -5,63 +5,451 @@ Validates HTML documents and generates detailed compliance reports
 
 from bs4 import BeautifulSoup
 import re
+from dataclasses import dataclass
 from datetime import datetime
 
+# Prefer lxml for parsing: it builds the same read-only tree several times
+# faster than html5lib. Fall back to html5lib where lxml is not installed.
+try:
+    from lxml import etree
+    BS4_PARSER = 'lxml'
+    HAS_LXML = True
+except ImportError:
+    etree = None
+    BS4_PARSER = 'html5lib'
+    HAS_LXML = False
+
+# selectolax's Lexbor engine parses and queries an order of magnitude faster
+# than BeautifulSoup and uses far less memory. All checks here are read-only,
+# so we use it when available and keep BeautifulSoup as the fallback path.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    LexborHTMLParser = None
+    HAS_SELECTOLAX = False
+
+
+# Tags collected in a single traversal and handed to the per-tag checks.
+# Headings share one bucket so their document order is preserved; the
+# form controls share one so check_forms sees them together.
+BUCKET_SELECTOR = 'h1, h2, h3, h4, h5, h6, img, a, table, input, select, textarea, label'
+HEADING_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+FORM_TAGS = frozenset(('input', 'select', 'textarea'))
+
+# HTML5 sectioning elements looked for by check_semantic_structure
+SEMANTIC_TAGS = ('header', 'nav', 'main', 'article', 'section', 'aside', 'footer')
+SEMANTIC_SELECTOR = ', '.join(SEMANTIC_TAGS)
+
+# BeautifulSoup re-resolves the feature string to a TreeBuilder class on
+# every construction; look the builder up in the registry once at import
+# time and hand it straight to the constructor instead.
+try:
+    from bs4.builder import builder_registry
+    BS4_BUILDER = builder_registry.lookup(BS4_PARSER)
+except (ImportError, AttributeError):
+    BS4_BUILDER = None
+
+# Documents at least this large are parsed incrementally with lxml's pull
+# parser instead of being materialised as a full tree, keeping peak memory
+# bounded regardless of input size
+STREAM_THRESHOLD = 5 * 1024 * 1024
+
+def _css_first(node, selector):
+    """First descendant matching a CSS selector, on either backend.
+
+    callable() guards the probes: bs4 4.12+ gives every tag a
+    non-callable .css namespace property, so the attribute existing is
+    not enough to pick the selectolax path.
+    """
+    css_first = getattr(node, 'css_first', None)
+    if callable(css_first):
+        return css_first(selector)
+    return node.select_one(selector)
+
+
+def _css(node, selector):
+    """All descendants matching a CSS selector, on either backend."""
+    css = getattr(node, 'css', None)
+    if callable(css):
+        return css(selector)
+    return node.select(selector)
+
+
+def _el_name(el):
+    """Tag name of an element, on either backend."""
+    name = getattr(el, 'name', None)
+    if name is not None:
+        return name
+    return el.tag
+
+
+def _el_attrs(el):
+    """Attribute dict of an element, on either backend."""
+    attrs = getattr(el, 'attrs', None)
+    if attrs is not None:
+        return attrs
+    return el.attributes
+
+
+def _el_text(el):
+    """Stripped text content of an element, on either backend."""
+    get_text = getattr(el, 'get_text', None)
+    if get_text is not None:
+        return get_text(strip=True)
+    return el.text(deep=True).strip()
+
+
+def _has_ancestor(el, name):
+    """Whether an element sits inside a tag of the given name."""
+    find_parent = getattr(el, 'find_parent', None)
+    if find_parent is not None:
+        return find_parent(name) is not None
+    in_label = getattr(el, 'in_label', None)
+    if in_label is not None:
+        # Streamed elements only record label ancestry; that is the only
+        # ancestor the checks ever ask about
+        return name == 'label' and in_label
+    parent = el.parent
+    while parent is not None:
+        if parent.tag == name:
+            return True
+        parent = parent.parent
+    return False
+
+
+# Tags whose text content the checks read; only these accumulate text on
+# the streaming path
+_STREAM_TEXT_TAGS = frozenset(('title', 'style', 'a', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+
+# Tags where only the first occurrence matters (root-level lookups)
+_STREAM_FIRST_TAGS = frozenset((
+    'html', 'head', 'title', 'body', 'main', 'style',
+    'header', 'nav', 'article', 'section', 'aside', 'footer',
+))
+
+# While one of these is open, finished descendants are kept alive because
+# the enclosing element still needs them (text or caption/th lookups)
+_STREAM_CONTAINER_TAGS = _STREAM_TEXT_TAGS | frozenset(('table', 'label'))
+
+
+class _StreamedElement:
+    """Lightweight stand-in for a tree node, built by the streaming path.
+
+    Exposes just the surface the check helpers use: .tag, .attrs, a text()
+    method, css()/css_first() over recorded children, and an in_label flag
+    for the form check.
+    """
+
+    __slots__ = ('tag', 'attrs', '_text', 'children', 'in_label')
+
+    def __init__(self, tag, attrs, text='', children=None, in_label=False):
+        self.tag = tag
+        self.attrs = attrs
+        self._text = text
+        self.children = children or []
+        self.in_label = in_label
+
+    def text(self, deep=True):
+        return self._text
+
+    def css_first(self, selector):
+        for child in self.children:
+            if child.tag == selector:
+                return child
+        return None
+
+    def css(self, selector):
+        return [child for child in self.children if child.tag == selector]
+
+
+class _StreamedDocument:
+    """Incrementally parsed document for very large HTML inputs.
+
+    Feeds the markup through lxml's HTMLPullParser in chunks, records only
+    the elements the checks look at as _StreamedElement shims, and frees
+    the underlying lxml nodes as soon as they are no longer needed, so peak
+    memory stays bounded by the chunk size plus the collected elements.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, html_content):
+        self._first = {}
+        self._collected = []
+        self._open_containers = 0
+
+        parser = etree.HTMLPullParser(events=('start', 'end'))
+        for start in range(0, len(html_content), self.CHUNK_SIZE):
+            parser.feed(html_content[start:start + self.CHUNK_SIZE])
+            self._handle_events(parser)
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            pass
+        self._handle_events(parser)
+
+    def _handle_events(self, parser):
+        for action, elem in parser.read_events():
+            tag = elem.tag
+            if not isinstance(tag, str):
+                # Comments and processing instructions
+                continue
+
+            if action == 'start':
+                if tag in _STREAM_CONTAINER_TAGS:
+                    self._open_containers += 1
+                continue
+
+            if tag in _STREAM_CONTAINER_TAGS:
+                self._open_containers -= 1
+
+            shim = None
+            if tag in HEADING_TAGS or tag in FORM_TAGS or tag in ('img', 'a', 'table', 'label'):
+                shim = self._make_shim(elem, tag)
+                self._collected.append(shim)
+            if tag in _STREAM_FIRST_TAGS and tag not in self._first:
+                self._first[tag] = shim if shim is not None else self._make_shim(elem, tag)
+
+            # Drop finished subtrees unless an enclosing element still
+            # needs its descendants intact
+            if self._open_containers == 0:
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+    def _make_shim(self, elem, tag):
+        attrs = dict(elem.attrib)
+        text = ''
+        if tag in _STREAM_TEXT_TAGS:
+            text = ''.join(elem.itertext())
+        children = None
+        if tag == 'table':
+            children = [_StreamedElement(sub.tag, dict(sub.attrib))
+                        for sub in elem.iter('caption', 'th')]
+        in_label = False
+        if tag in FORM_TAGS:
+            parent = elem.getparent()
+            while parent is not None:
+                if parent.tag == 'label':
+                    in_label = True
+                    break
+                parent = parent.getparent()
+        return _StreamedElement(tag, attrs, text, children, in_label)
+
+    def css_first(self, selector):
+        """Root-level lookup; the checks only ask for bare tag names."""
+        return self._first.get(selector)
+
+    def css(self, selector):
+        """Return the collected elements; only used for the bucket query."""
+        return self._collected
+
+
+@dataclass
+class Issue:
+    """A single issue, warning or passed check.
+
+    Slotted to keep per-issue memory down during batch scans; supports
+    dict-style access for existing consumers. __slots__ is declared by
+    hand because dataclass(slots=True) needs Python 3.10 and we support
+    3.8.
+    """
+
+    __slots__ = ('guideline', 'guideline_name', 'title', 'description',
+                 'remediation', 'severity', 'level', 'type')
+
+    guideline: str
+    guideline_name: str
+    title: str
+    description: str
+    remediation: str
+    severity: str
+    level: str
+    type: str
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def to_dict(self):
+        return {
+            'guideline': self.guideline,
+            'guideline_name': self.guideline_name,
+            'title': self.title,
+            'description': self.description,
+            'remediation': self.remediation,
+            'severity': self.severity,
+            'level': self.level,
+            'type': self.type,
+        }
+
+
+@dataclass
+class AccessibilityReport:
+    """Result of a full accessibility check.
+
+    Slotted attributes instead of a nested dict; to_dict() produces the
+    plain-dict form for JSON serialization. __slots__ is declared by
+    hand because dataclass(slots=True) needs Python 3.10 and we support
+    3.8.
+    """
+
+    __slots__ = ('timestamp', 'compliance_score', 'passes_wcag',
+                 'total_checks', 'passed_count', 'issues_count',
+                 'warnings_count', 'issues', 'warnings', 'passed_checks',
+                 'summary')
+
+    timestamp: str
+    compliance_score: int
+    passes_wcag: bool
+    total_checks: int
+    passed_count: int
+    issues_count: int
+    warnings_count: int
+    issues: list
+    warnings: list
+    passed_checks: list
+    summary: dict
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def to_dict(self):
+        return {
+            'timestamp': self.timestamp,
+            'compliance_score': self.compliance_score,
+            'passes_wcag': self.passes_wcag,
+            'total_checks': self.total_checks,
+            'passed_count': self.passed_count,
+            'issues_count': self.issues_count,
+            'warnings_count': self.warnings_count,
+            'issues': [issue.to_dict() for issue in self.issues],
+            'warnings': [warning.to_dict() for warning in self.warnings],
+            'passed_checks': self.passed_checks,
+            'summary': self.summary,
+        }
+
 
 class AccessibilityChecker:
+    # Compiled once; matched against every link href in check_skip_navigation
+    _SKIP_NAV_RE = re.compile(r'#.*content')
+
+    # Common low-contrast text colors, found in one case-insensitive scan of
+    # the stylesheet instead of one lowered-copy substring scan per pattern
+    _LOW_CONTRAST_RE = re.compile(r'color\s*:\s*(#999|#ccc|gray)', re.IGNORECASE)
+
+    # Link texts that say nothing about the destination; checked per anchor
+    _GENERIC_LINK_TEXTS = frozenset({'click here', 'read more', 'more', 'link', 'here'})
+
+    # Guidelines that are Level AA rather than Level A; frozenset gives O(1)
+    # membership on the per-issue hot path in add_issue
+    _AA_GUIDELINES = frozenset({'1.4.3', '2.4.6', '3.1.2'})
+
+    # Shared across all instances; a fresh checker is created per document in
+    # batch runs, so keep these off the per-instance construction path
+    WCAG_GUIDELINES = {
+        '1.1.1': 'Non-text Content (Level A)',
+        '1.3.1': 'Info and Relationships (Level A)',
+        '1.3.2': 'Meaningful Sequence (Level A)',
+        '1.4.3': 'Contrast (Minimum) (Level AA)',
+        '2.1.1': 'Keyboard (Level A)',
+        '2.4.1': 'Bypass Blocks (Level A)',
+        '2.4.2': 'Page Titled (Level A)',
+        '2.4.4': 'Link Purpose (In Context) (Level A)',
+        '2.4.6': 'Headings and Labels (Level AA)',
+        '3.1.1': 'Language of Page (Level A)',
+        '3.1.2': 'Language of Parts (Level AA)',
+        '4.1.2': 'Name, Role, Value (Level A)',
+    }
+
+    # Help resource links
+    HELP_RESOURCES = {
+        'adobe_headings': 'https://helpx.adobe.com/acrobat/using/editing-document-structure-content-tags.html#add_headings_to_a_pdf',
+        'adobe_tags': 'https://helpx.adobe.com/acrobat/using/editing-document-structure-content-tags.html',
+        'adobe_alt_text': 'https://helpx.adobe.com/acrobat/using/editing-document-structure-content-tags.html#add_alternate_text_and_supplementary_information',
+        'adobe_tables': 'https://helpx.adobe.com/acrobat/using/editing-document-structure-content-tags.html#edit_table_tags',
+        'adobe_reading_order': 'https://helpx.adobe.com/acrobat/using/touch-reading-order-tool-pdfs.html'
+    }
+
+    # Display labels for the help links appended by _remediation
+    _HELP_LABELS = {
+        'adobe_headings': 'Adobe Acrobat: Add Headings to PDF',
+        'adobe_tags': 'Adobe Acrobat: Document Structure and Tags',
+        'adobe_alt_text': 'Adobe Acrobat: Add Alternative Text',
+        'adobe_tables': 'Adobe Acrobat: Edit Table Tags',
+        'adobe_reading_order': 'Adobe Acrobat: Touch Up Reading Order',
+    }
+
+    def _remediation(self, body, key='adobe_tags'):
+        """Build remediation text with the shared 'Learn How to Fix' help link"""
+        return (f'{body}'
+                f'<br><br><strong>📚 Learn How to Fix:</strong><br>'
+                f'• <a href="{self.HELP_RESOURCES[key]}" target="_blank">{self._HELP_LABELS[key]}</a><br>')
+
     def __init__(self):
+        self._reset()
+
+    def _reset(self):
         self.issues = []
         self.warnings = []
         self.passed_checks = []
-        self.wcag_guidelines = {
-            '1.1.1': 'Non-text Content (Level A)',
-            '1.3.1': 'Info and Relationships (Level A)',
-            '1.3.2': 'Meaningful Sequence (Level A)',
-            '1.4.3': 'Contrast (Minimum) (Level AA)',
-            '2.1.1': 'Keyboard (Level A)',
-            '2.4.1': 'Bypass Blocks (Level A)',
-            '2.4.2': 'Page Titled (Level A)',
-            '2.4.4': 'Link Purpose (In Context) (Level A)',
-            '2.4.6': 'Headings and Labels (Level AA)',
-            '3.1.1': 'Language of Page (Level A)',
-            '3.1.2': 'Language of Parts (Level AA)',
-            '4.1.2': 'Name, Role, Value (Level A)',
-        }
+        # Severity -> target list dispatch for add_issue; unknown
+        # severities land with the warnings
+        self._severity_buckets = {'error': self.issues, 'warning': self.warnings}
 
-        # Help resource links
-        self.help_resources = {
-            'adobe_headings': 'https://helpx.adobe.com/acrobat/using/editing-document-structure-content-tags.html#add_headings_to_a_pdf',
-            'adobe_tags': 'https://helpx.adobe.com/acrobat/using/editing-document-structure-content-tags.html',
-            'adobe_alt_text': 'https://helpx.adobe.com/acrobat/using/editing-document-structure-content-tags.html#add_alternate_text_and_supplementary_information',
-            'adobe_tables': 'https://helpx.adobe.com/acrobat/using/editing-document-structure-content-tags.html#edit_table_tags',
-            'adobe_reading_order': 'https://helpx.adobe.com/acrobat/using/touch-reading-order-tool-pdfs.html'
-        }
-
-    def check_accessibility(self, html_content, ocr_warning=None):
+    def check_accessibility(self, html_content, ocr_warning=None, use_bs4=False):
         """Run all WCAG 2.2 AA accessibility checks"""
-        soup = BeautifulSoup(html_content, 'html5lib')
+        if HAS_LXML and not use_bs4 and len(html_content) >= STREAM_THRESHOLD:
+            root = _StreamedDocument(html_content)
+        elif HAS_SELECTOLAX and not use_bs4:
+            root = LexborHTMLParser(html_content)
+        elif BS4_BUILDER is not None:
+            root = BeautifulSoup(html_content, builder=BS4_BUILDER)
+        else:
+            root = BeautifulSoup(html_content, BS4_PARSER)
 
         # Reset issues
-        self.issues = []
-        self.warnings = []
-        self.passed_checks = []
+        self._reset()
 
         # Add OCR warning if provided
         if ocr_warning:
             self.add_ocr_warning(ocr_warning)
 
-        # Run checks
-        self.check_document_title(soup)
-        self.check_language(soup)
-        self.check_heading_hierarchy(soup)
-        self.check_images(soup)
-        self.check_links(soup)
-        self.check_tables(soup)
-        self.check_forms(soup)
-        self.check_skip_navigation(soup)
-        self.check_aria_landmarks(soup)
-        self.check_color_contrast(soup)
-        self.check_semantic_structure(soup)
+        # Collect every element the per-tag checks need in one traversal
+        # instead of re-walking the tree once per check. The backend is
+        # resolved once here rather than per element via _el_name.
+        is_bs4 = isinstance(root, BeautifulSoup)
+        buckets = {'headings': [], 'inputs': [], 'img': [], 'a': [],
+                   'table': [], 'label': []}
+        for el in _css(root, BUCKET_SELECTOR):
+            name = el.name if is_bs4 else el.tag
+            if name in HEADING_TAGS:
+                buckets['headings'].append(el)
+            elif name in FORM_TAGS:
+                buckets['inputs'].append(el)
+            else:
+                buckets[name].append(el)
+
+        # Run checks; root is kept only for the root-level queries
+        self.check_document_title(root)
+        self.check_language(root)
+        self.check_heading_hierarchy(buckets['headings'])
+        self.check_images(buckets['img'])
+        self.check_links(buckets['a'])
+        self.check_tables(buckets['table'])
+        self.check_forms(buckets['inputs'], buckets['label'])
+        self.check_skip_navigation(buckets['a'])
+        self.check_aria_landmarks(root)
+        self.check_color_contrast(root)
+        self.check_semantic_structure(root)
 
         # Generate report
         return self.generate_report()
@@ -72,139 +460,122 @@ class AccessibilityChecker:
             'N/A',
             'OCR Detection Warning',
             warning_message,
-            f'''Consider using OCR (Optical Character Recognition) tools to extract text from this PDF before remediation for best results. Scanned or graphically-rendered PDFs cannot be properly remediated without text content.
-            <br><br><strong>📚 Learn How to Fix:</strong><br>
-            • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+            self._remediation('''Consider using OCR (Optical Character Recognition) tools to extract text from this PDF before remediation for best results. Scanned or graphically-rendered PDFs cannot be properly remediated without text content.'''),
             'warning',
             'ocr_needed'
         )
 
     def add_issue(self, guideline, title, description, remediation, severity='error', issue_type='unknown'):
         """Add an accessibility issue"""
-        issue = {
-            'guideline': guideline,
-            'guideline_name': self.wcag_guidelines.get(guideline, 'Unknown'),
-            'title': title,
-            'description': description,
-            'remediation': remediation,
-            'severity': severity,
-            'level': 'AA' if guideline in ['1.4.3', '2.4.6', '3.1.2'] else 'A',
-            'type': issue_type
-        }
+        issue = Issue(
+            guideline=guideline,
+            guideline_name=self.WCAG_GUIDELINES.get(guideline, 'Unknown'),
+            title=title,
+            description=description,
+            remediation=remediation,
+            severity=severity,
+            level='AA' if guideline in self._AA_GUIDELINES else 'A',
+            type=issue_type
+        )
 
-        if severity == 'error':
-            self.issues.append(issue)
-        else:
-            self.warnings.append(issue)
+        self._severity_buckets.get(severity, self.warnings).append(issue)
 
     def add_passed_check(self, guideline, title):
         """Add a passed accessibility check"""
         self.passed_checks.append({
             'guideline': guideline,
-            'guideline_name': self.wcag_guidelines.get(guideline, 'Unknown'),
+            'guideline_name': self.WCAG_GUIDELINES.get(guideline, 'Unknown'),
             'title': title
         })
 
-    def check_document_title(self, soup):
+    def check_document_title(self, root):
         """Check if document has a title (WCAG 2.4.2)"""
-        title = soup.find('title')
+        title = _css_first(root, 'title')
 
-        if not title or not title.get_text(strip=True):
+        if not title or not _el_text(title):
             self.add_issue(
                 '2.4.2',
                 'Missing or Empty Page Title',
                 'The document does not have a title or the title is empty.',
-                f'''Add a descriptive &lt;title&gt; element in the &lt;head&gt; section that describes the page content.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                self._remediation('''Add a descriptive &lt;title&gt; element in the &lt;head&gt; section that describes the page content.'''),
                 'error',
                 'missing_title'
             )
         else:
-            title_text = title.get_text(strip=True)
+            title_text = _el_text(title)
             if len(title_text) < 3:
                 self.add_issue(
                     '2.4.2',
                     'Page Title Too Short',
                     f'The page title "{title_text}" is too short to be meaningful.',
-                    f'''Use a descriptive title that clearly identifies the page content (e.g., "Annual Report 2024" instead of "Document").
-                    <br><br><strong>📚 Learn How to Fix:</strong><br>
-                    • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                    self._remediation('''Use a descriptive title that clearly identifies the page content (e.g., "Annual Report 2024" instead of "Document").'''),
                     'warning'
                 )
             else:
                 self.add_passed_check('2.4.2', 'Page has a meaningful title')
 
-    def check_language(self, soup):
+    def check_language(self, root):
         """Check if document has language attribute (WCAG 3.1.1)"""
-        html_tag = soup.find('html')
+        html_tag = _css_first(root, 'html')
+        lang = _el_attrs(html_tag).get('lang') if html_tag else None
 
-        if not html_tag or not html_tag.get('lang'):
+        if not lang:
             self.add_issue(
                 '3.1.1',
                 'Missing Language Declaration',
                 'The HTML element does not have a lang attribute.',
-                f'''Add a lang attribute to the &lt;html&gt; element (e.g., &lt;html lang="en"&gt; for English).
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                self._remediation('''Add a lang attribute to the &lt;html&gt; element (e.g., &lt;html lang="en"&gt; for English).'''),
                 'error',
                 'missing_lang'
             )
         else:
-            lang = html_tag.get('lang')
             if len(lang) < 2:
                 self.add_issue(
                     '3.1.1',
                     'Invalid Language Code',
                     f'The lang attribute "{lang}" is not a valid language code.',
-                    f'''Use a valid ISO 639-1 language code (e.g., "en" for English, "es" for Spanish).
-                    <br><br><strong>📚 Learn How to Fix:</strong><br>
-                    • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                    self._remediation('''Use a valid ISO 639-1 language code (e.g., "en" for English, "es" for Spanish).'''),
                     'error'
                 )
             else:
                 self.add_passed_check('3.1.1', f'Document language declared as "{lang}"')
 
-    def check_heading_hierarchy(self, soup):
+    def check_heading_hierarchy(self, headings):
         """Check heading hierarchy (WCAG 2.4.6, 1.3.1)"""
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-
         if not headings:
             self.add_issue(
                 '2.4.6',
                 'No Headings Found',
                 'The document does not contain any headings.',
-                f'''Add headings (h1-h6) to structure your content hierarchically. Start with an h1 for the main title.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_headings']}" target="_blank">Adobe Acrobat: Add Headings to PDF</a><br>''',
+                self._remediation('''Add headings (h1-h6) to structure your content hierarchically. Start with an h1 for the main title.''', 'adobe_headings'),
                 'error',
                 'missing_headings'
             )
             return
 
         # Check if first heading is h1
-        first_heading = headings[0]
-        if first_heading.name != 'h1':
+        first_heading_name = _el_name(headings[0])
+        if first_heading_name != 'h1':
             self.add_issue(
                 '2.4.6',
                 'First Heading is Not H1',
-                f'The first heading is {first_heading.name.upper()}, not H1.',
-                f'''Ensure the first heading in your document is an h1 element.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_headings']}" target="_blank">Adobe Acrobat: Add Headings to PDF</a><br>''',
+                f'The first heading is {first_heading_name.upper()}, not H1.',
+                self._remediation('''Ensure the first heading in your document is an h1 element.''', 'adobe_headings'),
                 'error',
                 'wrong_first_heading'
             )
 
-        # Check for skipped levels
+        # Check for skipped levels, deduplicating as we go
         last_level = 0
-        skipped_levels = []
+        skipped_levels = set()
 
         for heading in headings:
-            current_level = int(heading.name[1])
+            # ord() - 48 turns the digit in 'h1'..'h6' into its level
+            # without an int() parse per heading
+            current_level = ord(_el_name(heading)[1]) - 48
 
-            if last_level > 0 and current_level > last_level + 1:
-                skipped_levels.append(f'h{last_level} to h{current_level}')
+            if last_level and current_level > last_level + 1:
+                skipped_levels.add(f'h{last_level} to h{current_level}')
 
             last_level = current_level
 
@@ -212,10 +583,8 @@ class AccessibilityChecker:
             self.add_issue(
                 '1.3.1',
                 'Skipped Heading Levels',
-                f'Heading levels are skipped: {", ".join(set(skipped_levels))}',
-                f'''Do not skip heading levels. After h1, use h2; after h2, use h3, etc.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_headings']}" target="_blank">Adobe Acrobat: Add Headings to PDF</a><br>''',
+                f'Heading levels are skipped: {", ".join(skipped_levels)}',
+                self._remediation('''Do not skip heading levels. After h1, use h2; after h2, use h3, etc.''', 'adobe_headings'),
                 'error',
                 'skipped_heading_levels'
             )
@@ -223,56 +592,46 @@ class AccessibilityChecker:
             self.add_passed_check('2.4.6', 'Heading hierarchy is logical (no skipped levels)')
 
         # Check for empty headings
-        empty_headings = [h for h in headings if not h.get_text(strip=True)]
+        empty_headings = [h for h in headings if not _el_text(h)]
         if empty_headings:
             self.add_issue(
                 '2.4.6',
                 'Empty Headings Found',
                 f'Found {len(empty_headings)} empty heading(s).',
-                f'''Ensure all headings contain descriptive text.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_headings']}" target="_blank">Adobe Acrobat: Add Headings to PDF</a><br>''',
+                self._remediation('''Ensure all headings contain descriptive text.''', 'adobe_headings'),
                 'error'
             )
         else:
             self.add_passed_check('2.4.6', 'All headings contain text')
 
-    def check_images(self, soup):
+    def check_images(self, images):
         """Check images have alt text (WCAG 1.1.1)"""
-        images = soup.find_all('img')
-
         if not images:
             self.add_passed_check('1.1.1', 'No images found')
             return
 
         missing_alt = []
-        empty_alt = []
 
         for img in images:
-            if not img.has_attr('alt'):
-                missing_alt.append(img.get('src', 'unknown'))
-            elif not img['alt'].strip():
-                # Empty alt is okay for decorative images
-                pass
+            attrs = _el_attrs(img)
+            if 'alt' not in attrs:
+                missing_alt.append(attrs.get('src', 'unknown'))
+            # Empty alt is okay for decorative images
 
         if missing_alt:
             self.add_issue(
                 '1.1.1',
                 'Images Missing Alt Text',
                 f'{len(missing_alt)} image(s) do not have alt attributes.',
-                f'''Add alt attributes to all images. Use descriptive text for meaningful images, or alt="" for decorative images.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_alt_text']}" target="_blank">Adobe Acrobat: Add Alternative Text</a><br>''',
+                self._remediation('''Add alt attributes to all images. Use descriptive text for meaningful images, or alt="" for decorative images.''', 'adobe_alt_text'),
                 'error',
                 'missing_alt_text'
             )
         else:
             self.add_passed_check('1.1.1', f'All {len(images)} images have alt attributes')
 
-    def check_links(self, soup):
+    def check_links(self, links):
         """Check links are accessible (WCAG 2.4.4)"""
-        links = soup.find_all('a')
-
         if not links:
             self.add_passed_check('2.4.4', 'No links found')
             return
@@ -280,21 +639,29 @@ class AccessibilityChecker:
         issues_found = []
 
         for link in links:
-            link_text = link.get_text(strip=True)
-            href = link.get('href', '')
+            attrs = _el_attrs(link)
+            link_text = _el_text(link)
+            href = attrs.get('href') or ''
 
             # Check for empty link text
             if not link_text:
                 issues_found.append(f'Empty link: {href[:50]}')
 
             # Check for generic link text
-            generic_texts = ['click here', 'read more', 'more', 'link', 'here']
-            if link_text.lower() in generic_texts:
+            if link_text.lower() in self._GENERIC_LINK_TEXTS:
                 issues_found.append(f'Generic link text: "{link_text}"')
 
-            # Check external links have security attributes
-            if href.startswith('http'):
-                if not link.get('rel') or 'noopener' not in link.get('rel', []):
+            # Fragment, mailto and tel links cannot be external; skip the
+            # rel check for them entirely
+            if href.startswith(('#', 'mailto:', 'tel:')):
+                continue
+
+            # Check external links have security attributes. The explicit
+            # scheme tuple is a single C-level call and no longer matches
+            # bogus schemes like "httpfoo:".
+            if href.startswith(('http://', 'https://')):
+                rel = attrs.get('rel')
+                if not rel or 'noopener' not in rel:
                     issues_found.append(f'External link missing security attributes: {link_text[:50]}')
 
         if issues_found:
@@ -302,18 +669,14 @@ class AccessibilityChecker:
                 '2.4.4',
                 'Link Accessibility Issues',
                 f'Found {len(issues_found)} link issue(s).',
-                f'''Ensure links have descriptive text. Avoid generic phrases like "click here". Add rel="noopener noreferrer" to external links.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                self._remediation('''Ensure links have descriptive text. Avoid generic phrases like "click here". Add rel="noopener noreferrer" to external links.'''),
                 'warning'
             )
         else:
             self.add_passed_check('2.4.4', f'All {len(links)} links have descriptive text')
 
-    def check_tables(self, soup):
+    def check_tables(self, tables):
         """Check tables are accessible (WCAG 1.3.1)"""
-        tables = soup.find_all('table')
-
         if not tables:
             self.add_passed_check('1.3.1', 'No tables found')
             return
@@ -322,22 +685,22 @@ class AccessibilityChecker:
 
         for i, table in enumerate(tables, 1):
             # Check for caption
-            if not table.find('caption'):
+            if not _css_first(table, 'caption'):
                 issues_found.append(f'Table {i} missing caption')
 
             # Check for headers
-            headers = table.find_all('th')
+            headers = _css(table, 'th')
             if not headers:
                 issues_found.append(f'Table {i} has no header cells (th)')
             else:
                 # Check headers have scope
                 for th in headers:
-                    if not th.get('scope'):
+                    if not _el_attrs(th).get('scope'):
                         issues_found.append(f'Table {i} header missing scope attribute')
                         break
 
             # Check for role
-            if not table.get('role'):
+            if not _el_attrs(table).get('role'):
                 issues_found.append(f'Table {i} missing role="table"')
 
         if issues_found:
@@ -345,134 +708,114 @@ class AccessibilityChecker:
                 '1.3.1',
                 'Table Accessibility Issues',
                 f'Found issues in {len(set(issues_found))} table(s).',
-                f'''Add captions to tables, use &lt;th&gt; elements for headers with scope attributes, and add role="table" for ARIA support.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_tables']}" target="_blank">Adobe Acrobat: Edit Table Tags</a><br>''',
+                self._remediation('''Add captions to tables, use &lt;th&gt; elements for headers with scope attributes, and add role="table" for ARIA support.''', 'adobe_tables'),
                 'error',
                 'table_accessibility'
             )
         else:
             self.add_passed_check('1.3.1', f'All {len(tables)} tables are properly structured')
 
-    def check_forms(self, soup):
+    def check_forms(self, inputs, labels):
         """Check form accessibility (WCAG 4.1.2)"""
-        inputs = soup.find_all(['input', 'select', 'textarea'])
-
         if not inputs:
             self.add_passed_check('4.1.2', 'No form elements found')
             return
 
+        # Index the label targets once; O(inputs + labels) instead of
+        # rescanning the label list for every control
+        label_fors = {_el_attrs(label).get('for') for label in labels}
+        label_fors.discard(None)
+
         unlabeled = []
 
         for input_elem in inputs:
-            elem_id = input_elem.get('id')
+            attrs = _el_attrs(input_elem)
+            elem_id = attrs.get('id')
             has_label = False
 
             # Check for label element
-            if elem_id:
-                label = soup.find('label', attrs={'for': elem_id})
-                if label:
-                    has_label = True
+            if elem_id and elem_id in label_fors:
+                has_label = True
 
             # Check for parent label
-            if not has_label:
-                parent_label = input_elem.find_parent('label')
-                if parent_label:
-                    has_label = True
+            if not has_label and _has_ancestor(input_elem, 'label'):
+                has_label = True
 
             # Check for aria-label
-            if not has_label and input_elem.get('aria-label'):
+            if not has_label and attrs.get('aria-label'):
                 has_label = True
 
             if not has_label:
-                unlabeled.append(input_elem.name)
+                unlabeled.append(_el_name(input_elem))
 
         if unlabeled:
             self.add_issue(
                 '4.1.2',
                 'Form Elements Missing Labels',
                 f'{len(unlabeled)} form element(s) do not have associated labels.',
-                f'''Associate labels with form controls using &lt;label for="id"&gt; or wrap inputs in &lt;label&gt; tags. Alternatively, use aria-label attributes.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                self._remediation('''Associate labels with form controls using &lt;label for="id"&gt; or wrap inputs in &lt;label&gt; tags. Alternatively, use aria-label attributes.'''),
                 'error'
             )
         else:
             self.add_passed_check('4.1.2', f'All {len(inputs)} form elements have labels')
 
-    def check_skip_navigation(self, soup):
+    def check_skip_navigation(self, links):
         """Check for skip navigation link (WCAG 2.4.1)"""
-        skip_links = soup.find_all('a', href=re.compile(r'#.*content'))
+        skip_links = [a for a in links
+                      if self._SKIP_NAV_RE.search(_el_attrs(a).get('href') or '')]
 
         if not skip_links:
             self.add_issue(
                 '2.4.1',
                 'Missing Skip Navigation Link',
                 'No skip navigation link found.',
-                f'''Add a "Skip to main content" link at the beginning of the page that links to the main content area.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                self._remediation('''Add a "Skip to main content" link at the beginning of the page that links to the main content area.'''),
                 'error'
             )
         else:
             self.add_passed_check('2.4.1', 'Skip navigation link present')
 
-    def check_aria_landmarks(self, soup):
+    def check_aria_landmarks(self, root):
         """Check for ARIA landmarks (WCAG 1.3.1)"""
-        main_element = soup.find('main')
+        main_element = _css_first(root, 'main')
 
         if not main_element:
             self.add_issue(
                 '1.3.1',
                 'Missing Main Landmark',
                 'No &lt;main&gt; element found.',
-                f'''Wrap the main content in a &lt;main&gt; element.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                self._remediation('''Wrap the main content in a &lt;main&gt; element.'''),
                 'error'
             )
         else:
-            if not main_element.get('role'):
+            if not _el_attrs(main_element).get('role'):
                 self.add_issue(
                     '1.3.1',
                     'Main Element Missing Role',
                     'The &lt;main&gt; element does not have role="main".',
-                    f'''Add role="main" to the &lt;main&gt; element.
-                    <br><br><strong>📚 Learn How to Fix:</strong><br>
-                    • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                    self._remediation('''Add role="main" to the &lt;main&gt; element.'''),
                     'warning'
                 )
             else:
                 self.add_passed_check('1.3.1', 'Main landmark properly defined')
 
-    def check_color_contrast(self, soup):
+    def check_color_contrast(self, root):
         """Check color contrast in CSS (WCAG 1.4.3)"""
         # This is a simplified check - full contrast checking requires rendering
-        style_tag = soup.find('style')
+        style_tag = _css_first(root, 'style')
 
         if style_tag:
-            style_content = style_tag.string
+            style_content = _el_text(style_tag)
             if style_content:
                 # Check for common low-contrast patterns
-                low_contrast_patterns = [
-                    ('color: #999', 'background'),
-                    ('color: #ccc', 'background'),
-                    ('color: gray', 'background')
-                ]
-
-                issues_found = []
-                for pattern, context in low_contrast_patterns:
-                    if pattern in style_content.lower():
-                        issues_found.append(pattern)
+                issues_found = self._LOW_CONTRAST_RE.findall(style_content)
 
                 if issues_found:
                     self.add_issue(
                         '1.4.3',
                         'Potential Color Contrast Issues',
                         'Found potential low-contrast color combinations in CSS.',
-                        f'''Ensure text has a contrast ratio of at least 4.5:1 for normal text and 3:1 for large text. Use a contrast checker tool.
-                        <br><br><strong>📚 Learn How to Fix:</strong><br>
-                        • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                        self._remediation('''Ensure text has a contrast ratio of at least 4.5:1 for normal text and 3:1 for large text. Use a contrast checker tool.'''),
                         'warning'
                     )
                 else:
@@ -480,34 +823,35 @@ class AccessibilityChecker:
         else:
             self.add_passed_check('1.4.3', 'No inline styles to check')
 
-    def check_semantic_structure(self, soup):
+    def check_semantic_structure(self, root):
         """Check for semantic HTML structure (WCAG 1.3.1)"""
-        body = soup.find('body')
+        body = _css_first(root, 'body')
 
         if not body:
             self.add_issue(
                 '1.3.1',
                 'Missing Body Element',
                 'No &lt;body&gt; element found.',
-                f'''Ensure the document has a proper HTML structure with &lt;body&gt; element.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                self._remediation('''Ensure the document has a proper HTML structure with &lt;body&gt; element.'''),
                 'error'
             )
             return
 
-        # Check for proper use of semantic elements
-        semantic_elements = ['header', 'nav', 'main', 'article', 'section', 'aside', 'footer']
-        found_elements = [elem for elem in semantic_elements if soup.find(elem)]
+        # Check for proper use of semantic elements with a single grouped
+        # query instead of one full-tree scan per tag. The streamed
+        # document already indexes first occurrences, so ask it directly.
+        if isinstance(root, _StreamedDocument):
+            found_elements = [elem for elem in SEMANTIC_TAGS if root.css_first(elem)]
+        else:
+            present = {_el_name(el) for el in _css(root, SEMANTIC_SELECTOR)}
+            found_elements = [elem for elem in SEMANTIC_TAGS if elem in present]
 
         if len(found_elements) < 2:
             self.add_issue(
                 '1.3.1',
                 'Limited Semantic Structure',
                 'The document uses few or no semantic HTML5 elements.',
-                f'''Use semantic HTML5 elements like &lt;header&gt;, &lt;nav&gt;, &lt;main&gt;, &lt;article&gt;, &lt;section&gt;, &lt;aside&gt;, and &lt;footer&gt; to structure your content.
-                <br><br><strong>📚 Learn How to Fix:</strong><br>
-                • <a href="{self.help_resources['adobe_tags']}" target="_blank">Adobe Acrobat: Document Structure and Tags</a><br>''',
+                self._remediation('''Use semantic HTML5 elements like &lt;header&gt;, &lt;nav&gt;, &lt;main&gt;, &lt;article&gt;, &lt;section&gt;, &lt;aside&gt;, and &lt;footer&gt; to structure your content.'''),
                 'warning'
             )
         else:
@@ -529,21 +873,19 @@ class AccessibilityChecker:
         # Determine pass/fail status
         passes_wcag = issues_count == 0
 
-        report = {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'compliance_score': compliance_score,
-            'passes_wcag': passes_wcag,
-            'total_checks': total_checks,
-            'passed_count': passed_count,
-            'issues_count': issues_count,
-            'warnings_count': warnings_count,
-            'issues': self.issues,
-            'warnings': self.warnings,
-            'passed_checks': self.passed_checks,
-            'summary': self.generate_summary(passes_wcag, compliance_score)
-        }
-
-        return report
+        return AccessibilityReport(
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            compliance_score=compliance_score,
+            passes_wcag=passes_wcag,
+            total_checks=total_checks,
+            passed_count=passed_count,
+            issues_count=issues_count,
+            warnings_count=warnings_count,
+            issues=self.issues,
+            warnings=self.warnings,
+            passed_checks=self.passed_checks,
+            summary=self.generate_summary(passes_wcag, compliance_score)
+        )
 
     def generate_summary(self, passes_wcag, compliance_score):
         """Generate executive summary"""
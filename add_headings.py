@@ -7,7 +7,12 @@ import pikepdf
 from pikepdf import Name, Array, Dictionary, String
 import sys
 
-def add_heading_structure(input_path, output_path):
+# pikepdf Name construction crosses into C++; build the names used for
+# every heading element once at import time
+_STRUCT_ELEM = Name('/StructElem')
+_H_NAMES = {i: Name(f'/H{i}') for i in range(1, 7)}
+
+def add_heading_structure(input_path, output_path, verbose=False):
     """Add proper heading tags to the PDF structure tree."""
 
     pdf = pikepdf.open(input_path)
@@ -47,18 +52,33 @@ def add_heading_structure(input_path, output_path):
 
     print(f"Adding {len(headings)} headings to the PDF...")
 
-    # Add heading structure elements
+    # Resolve each referenced page object once; pikepdf page indexing
+    # walks the page tree, so avoid repeating it per heading
+    page_objs = {i: pdf.pages[i].obj for i in {h["page"] for h in headings}}
+
+    # Build all heading structure elements first, then rewrite /K once
+    # instead of appending through the indirect reference per heading.
+    # Per-heading output is buffered and written in one go so large
+    # heading lists don't pay a stdout write per element.
+    new_elements = []
+    log_lines = []
     for heading in headings:
         heading_elem = pdf.make_indirect(Dictionary({
-            '/Type': Name('/StructElem'),
-            '/S': Name(f'/H{heading["level"]}'),
+            '/Type': _STRUCT_ELEM,
+            '/S': _H_NAMES[heading["level"]],
             '/P': struct_tree,
             '/T': String(heading["text"]),
-            '/Pg': pdf.pages[heading["page"]].obj
+            '/Pg': page_objs[heading["page"]]
         }))
 
-        struct_elements.append(heading_elem)
-        print(f"  Added H{heading['level']}: {heading['text'][:50]}...")
+        new_elements.append(heading_elem)
+        if verbose:
+            log_lines.append(f"  Added H{heading['level']}: {heading['text'][:50]}...")
+
+    if log_lines:
+        sys.stdout.write('\n'.join(log_lines) + '\n')
+
+    struct_tree['/K'] = Array(list(struct_elements) + new_elements)
 
     # Mark the document as tagged
     if '/MarkInfo' not in pdf.Root:
@@ -85,7 +105,7 @@ if __name__ == "__main__":
     output_file = sys.argv[2]
 
     try:
-        num_headings = add_heading_structure(input_file, output_file)
+        num_headings = add_heading_structure(input_file, output_file, verbose=True)
         print(f"\n✓ Successfully added {num_headings} headings")
     except Exception as e:
         print(f"Error: {e}")
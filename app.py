@@ -4,17 +4,246 @@ PDF Remediation Tool
 Converts PDF to HTML, remediates for WCAG 2.2 AA compliance, and converts back to PDF
 """
 
-from flask import Flask, render_template, request, send_file, jsonify, Response
+from flask import Flask, render_template, request, send_file, Response, stream_with_context
 import os
+import tempfile
 from werkzeug.utils import secure_filename
 import uuid
 from pdf_processor import PDFProcessor
 from accessibility_checker import AccessibilityChecker
 from report_generator import ReportGenerator
+import hashlib
 import shutil
 import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    # orjson serializes straight to bytes, a few times faster than stdlib
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps_bytes(obj):
+        return orjson.dumps(obj)
+
+    def _json_dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def _json_dumps_pretty(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def json_response(obj, status=200):
+    """Serialize a response body without jsonify's pure-Python encoder."""
+    return Response(_json_dumps_bytes(obj), status=status,
+                    mimetype='application/json')
+
+# Copy buffer for spooling uploads to disk
+UPLOAD_COPY_BUFFER = 1 << 20
+
+# PDF parsing is CPU-bound; running it out-of-process keeps the Flask
+# worker responsive and sidesteps the GIL. Report rendering and the
+# report file writes share a small thread pool: enough workers for the
+# render plus the three independent writes to overlap.
+PDF_POOL = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 4))
+REPORT_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+def _write_bytes(path, data):
+    """Write a bytes payload to a file; runs on the report pool."""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _write_text(path, text):
+    """Write a text payload to a file; runs on the report pool."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+# Process-local session store so the API routes don't re-read and
+# re-parse the same report/HTML files on every hit; LRU-capped so a
+# long-running server can't grow it without bound
+SESSION_CACHE_MAX = 512
+SESSION_CACHE = OrderedDict()  # session_id -> {'report', 'html', 'html_path', 'pdf_path', 'html_report'}
+_session_lock = threading.Lock()
+
+
+def _session_cache_put(session_id, **fields):
+    """Merge fields into a session's cache entry, evicting the oldest."""
+    with _session_lock:
+        entry = SESSION_CACHE.setdefault(session_id, {})
+        entry.update(fields)
+        SESSION_CACHE.move_to_end(session_id)
+        while len(SESSION_CACHE) > SESSION_CACHE_MAX:
+            SESSION_CACHE.popitem(last=False)
+
+
+def _session_cache_get(session_id, field):
+    """Fetch one cached field for a session, or None."""
+    with _session_lock:
+        entry = SESSION_CACHE.get(session_id)
+        if entry is None:
+            return None
+        SESSION_CACHE.move_to_end(session_id)
+        return entry.get(field)
+
+
+def _find_output_file(output_folder, suffix):
+    """Locate the first file in a folder with the given suffix.
+
+    Slow path for cold sessions only; warm sessions resolve their output
+    paths from SESSION_CACHE without touching the filesystem. scandir
+    avoids the extra stat that listdir + path.join would cost.
+    """
+    n = len(suffix)
+    try:
+        with os.scandir(output_folder) as entries:
+            for entry in entries:
+                # Slice-compare the tail instead of a bound endswith call;
+                # entry.path reuses the joined path scandir already built
+                if entry.name[-n:] == suffix:
+                    return entry.path
+    except FileNotFoundError:
+        pass
+    return None
+
+
+# Debounced write-behind for interactive fixes: consecutive fixes edit
+# the in-memory HTML only, and the file write plus PDF re-render (the
+# dominant cost) run once after the burst settles
+FLUSH_DELAY = 2.0
+_flush_timers = {}  # session_id -> (Timer, html_path, output_folder)
+_flush_lock = threading.Lock()
+
+
+def _write_session_files(session_id, html_path, output_folder):
+    """Persist the canonical in-memory HTML and re-render the PDF."""
+    html_content = _session_cache_get(session_id, 'html')
+    if html_content is None:
+        return
+    try:
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        pdf_path = (_session_cache_get(session_id, 'pdf_path')
+                    or _find_output_file(output_folder, '_remediated.pdf'))
+        if pdf_path:
+            processor.html_to_pdf_with_browser(html_content, pdf_path)
+    except Exception as e:
+        print(f"Warning: could not flush session {session_id}: {e}")
+
+
+def _flush_timer_fired(session_id, html_path, output_folder):
+    with _flush_lock:
+        _flush_timers.pop(session_id, None)
+    _write_session_files(session_id, html_path, output_folder)
+
+
+def _schedule_flush(session_id, html_path, output_folder):
+    """(Re)arm the per-session timer that persists fixed HTML."""
+    with _flush_lock:
+        entry = _flush_timers.pop(session_id, None)
+        if entry is not None:
+            entry[0].cancel()
+        timer = threading.Timer(FLUSH_DELAY, _flush_timer_fired,
+                                args=(session_id, html_path, output_folder))
+        timer.daemon = True
+        _flush_timers[session_id] = (timer, html_path, output_folder)
+        timer.start()
+
+
+def _flush_pending(session_id):
+    """Run a scheduled flush now (e.g. before serving a download)."""
+    with _flush_lock:
+        entry = _flush_timers.pop(session_id, None)
+        if entry is None:
+            return
+        timer, html_path, output_folder = entry
+        timer.cancel()
+    _write_session_files(session_id, html_path, output_folder)
+
+
+# Byte-identical resubmits (same content hash and title) reuse the prior
+# session's outputs instead of rerunning the whole pipeline
+DEDUP_TTL = 3600  # seconds a cached pipeline result stays reusable
+DEDUP_CACHE = {}  # '<sha256>:<title>' -> (output_folder, payload, created_at)
+_dedup_lock = threading.Lock()
+
+
+def _sha256_file(path):
+    """Streaming SHA-256 of a file, 64 KiB at a time."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _dedup_lookup(cache_key):
+    """Return a live cached (output_folder, payload) or None."""
+    with _dedup_lock:
+        entry = DEDUP_CACHE.get(cache_key)
+        if entry is None:
+            return None
+        output_folder, payload, created_at = entry
+        if time.time() - created_at > DEDUP_TTL or not os.path.isdir(output_folder):
+            # Expired, or the session was cleaned up underneath us
+            del DEDUP_CACHE[cache_key]
+            return None
+        return output_folder, payload
+
+
+def _purge_expired_dedup():
+    """Drop expired dedup entries.
+
+    Lookups only evict the exact key they probe, so without this sweep
+    every distinct upload would leave its payload in memory for the life
+    of the server. Returns the number of entries removed.
+    """
+    cutoff = time.time() - DEDUP_TTL
+    with _dedup_lock:
+        expired = [key for key, (_, _, created_at) in DEDUP_CACHE.items()
+                   if created_at < cutoff]
+        for key in expired:
+            del DEDUP_CACHE[key]
+    return len(expired)
+
+
+def _process_pdf_job(input_path, output_folder, document_title):
+    """Run one PDF conversion in a worker process.
+
+    Each worker builds its own PDFProcessor so no library state crosses
+    the process boundary — only paths in, plain dicts out.
+    """
+    worker = PDFProcessor()
+    result = worker.process_pdf(input_path, output_folder,
+                                document_title=document_title)
+    return result, worker.ocr_warning
+
+
+class DiskSpooledRequest(Flask.request_class):
+    """Request that spools multipart file parts straight to disk.
+
+    Werkzeug's default stream factory buffers small files in RAM and
+    re-copies every byte through its spooling logic; a 50MB PDF upload
+    should cost O(buffer), not O(filesize), of memory.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        return tempfile.TemporaryFile('wb+', dir=app.config['UPLOAD_FOLDER'])
+
 
 app = Flask(__name__)
+app.request_class = DiskSpooledRequest
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['OUTPUT_FOLDER'] = 'outputs'
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max file size
@@ -23,6 +252,73 @@ app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max file size
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 os.makedirs(app.config['OUTPUT_FOLDER'], exist_ok=True)
 
+
+def session_path(root, session_id):
+    """Per-session directory under a hashed two-level layout.
+
+    Flat uploads/<id> directories degrade once thousands of sessions
+    accumulate — every lookup scans one huge directory. Bucketing by the
+    first four hex characters of the session id keeps each directory
+    small: root/<id[:2]>/<id[2:4]>/<id>.
+    """
+    return os.path.join(root, session_id[:2], session_id[2:4], session_id)
+
+
+def save_upload(file, input_path):
+    """Copy an uploaded file part to its session path with a 1 MiB buffer."""
+    with open(input_path, 'wb') as f:
+        shutil.copyfileobj(file.stream, f, length=UPLOAD_COPY_BUFFER)
+
+
+# Abandoned sessions (clients that never call /cleanup) used to live
+# forever, eating disk and inodes; a background sweep reclaims them
+SESSION_GRACE_PERIOD = 24 * 3600  # seconds before an untouched session is stale
+CLEANUP_INTERVAL = 600  # seconds between sweeps
+
+
+def _sweep_stale_sessions(root, grace_period=SESSION_GRACE_PERIOD):
+    """Remove session directories untouched for longer than the grace period.
+
+    Walks the two-level hashed layout with os.scandir so each level is a
+    single readdir, and compares directory mtimes against the cutoff.
+    Returns the number of sessions removed.
+    """
+    cutoff = time.time() - grace_period
+    removed = 0
+    try:
+        with os.scandir(root) as buckets:
+            bucket_paths = [b.path for b in buckets if b.is_dir()]
+    except FileNotFoundError:
+        return 0
+    for bucket in bucket_paths:
+        with os.scandir(bucket) as subs:
+            sub_paths = [s.path for s in subs if s.is_dir()]
+        for sub in sub_paths:
+            with os.scandir(sub) as sessions:
+                for entry in sessions:
+                    try:
+                        if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                            removed += 1
+                    except OSError:
+                        continue
+    return removed
+
+
+def _cleanup_loop():
+    while True:
+        time.sleep(CLEANUP_INTERVAL)
+        for root in (app.config['UPLOAD_FOLDER'], app.config['OUTPUT_FOLDER']):
+            try:
+                _sweep_stale_sessions(root)
+            except Exception as e:
+                print(f"Warning: session sweep failed for {root}: {e}")
+        _purge_expired_dedup()
+
+
+threading.Thread(target=_cleanup_loop, name='session-sweeper',
+                 daemon=True).start()
+
 processor = PDFProcessor()
 checker = AccessibilityChecker()
 report_gen = ReportGenerator()
@@ -31,240 +327,411 @@ report_gen = ReportGenerator()
 def index():
     return render_template('index.html')
 
+def run_remediation_pipeline(input_path, filename, session_id, document_title):
+    """Remediate one uploaded PDF and build the /upload response payload."""
+    if not document_title:
+        # Fallback to filename-based title
+        document_title = os.path.splitext(filename)[0].replace('_', ' ')
+
+    output_folder = session_path(app.config['OUTPUT_FOLDER'], session_id)
+
+    # Short-circuit byte-identical resubmits: copy the prior session's
+    # outputs into this session and return the same payload
+    cache_key = f'{_sha256_file(input_path)}:{document_title}'
+    cached = _dedup_lookup(cache_key)
+    if cached is not None:
+        cached_folder, payload = cached
+        shutil.copytree(cached_folder, output_folder, dirs_exist_ok=True)
+        _session_cache_put(
+            session_id,
+            html_path=os.path.join(output_folder, payload['html_file']),
+            pdf_path=os.path.join(output_folder, payload['pdf_file']))
+        return dict(payload, session_id=session_id)
+
+    # Process the PDF
+    os.makedirs(output_folder, exist_ok=True)
+
+    result, ocr_warning = PDF_POOL.submit(
+        _process_pdf_job, input_path, output_folder, document_title
+    ).result()
+
+    # Run accessibility check on the remediated HTML the worker already
+    # holds in memory — no need to read back the file it just wrote
+    html_path = os.path.join(output_folder, result['html_file'])
+    html_content = result['html_content']
+
+    # Pass OCR warning if detected
+    accessibility_report = checker.check_accessibility(html_content, ocr_warning).to_dict()
+
+    # Render the HTML report concurrently with the JSON and text writes;
+    # the three outputs only depend on the report dict, not each other,
+    # so each lands on the report pool as soon as its bytes exist
+    html_report_future = REPORT_POOL.submit(report_gen.generate_html_report,
+                                            accessibility_report)
+
+    report_path = os.path.join(output_folder, 'accessibility_report.json')
+    writes = [REPORT_POOL.submit(_write_bytes, report_path,
+                                 _json_dumps_pretty(accessibility_report))]
+
+    text_report = report_gen.generate_text_report(accessibility_report)
+    text_report_path = os.path.join(output_folder, 'accessibility_report.txt')
+    writes.append(REPORT_POOL.submit(_write_text, text_report_path, text_report))
+
+    html_report = html_report_future.result()
+    html_report_path = os.path.join(output_folder, 'accessibility_report.html')
+    writes.append(REPORT_POOL.submit(_write_text, html_report_path, html_report))
+
+    # Surface any write failure before reporting success to the client
+    for write in writes:
+        write.result()
+
+    payload = {
+        'success': True,
+        'session_id': session_id,
+        'html_file': result['html_file'],
+        'pdf_file': result['pdf_file'],
+        'original_name': filename,
+        'accessibility_report': accessibility_report,
+        'has_issues': accessibility_report['issues_count'] > 0 or accessibility_report['warnings_count'] > 0
+    }
+
+    with _dedup_lock:
+        DEDUP_CACHE[cache_key] = (output_folder, payload, time.time())
+
+    _session_cache_put(session_id, report=accessibility_report,
+                       html=html_content, html_path=html_path,
+                       pdf_path=os.path.join(output_folder, result['pdf_file']),
+                       html_report=html_report)
+
+    return payload
+
 @app.route('/upload', methods=['POST'])
 def upload_file():
     try:
         if 'file' not in request.files:
-            return jsonify({'error': 'No file provided'}), 400
+            return json_response({'error': 'No file provided'}, 400)
 
         file = request.files['file']
         if file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
+            return json_response({'error': 'No file selected'}, 400)
 
         if not file.filename.lower().endswith('.pdf'):
-            return jsonify({'error': 'Only PDF files are allowed'}), 400
+            return json_response({'error': 'Only PDF files are allowed'}, 400)
 
         # Generate unique session ID
         session_id = str(uuid.uuid4())
-        session_folder = os.path.join(app.config['UPLOAD_FOLDER'], session_id)
+        session_folder = session_path(app.config['UPLOAD_FOLDER'], session_id)
         os.makedirs(session_folder, exist_ok=True)
 
         # Save uploaded file
         filename = secure_filename(file.filename)
         input_path = os.path.join(session_folder, filename)
-        file.save(input_path)
+        save_upload(file, input_path)
 
         # Get custom document title from form
         document_title = request.form.get('document_title', '').strip()
-        if not document_title:
-            # Fallback to filename-based title
-            document_title = os.path.splitext(filename)[0].replace('_', ' ')
 
-        # Process the PDF
-        output_folder = os.path.join(app.config['OUTPUT_FOLDER'], session_id)
-        os.makedirs(output_folder, exist_ok=True)
+        return json_response(run_remediation_pipeline(input_path, filename,
+                                                session_id, document_title))
 
-        result = processor.process_pdf(input_path, output_folder, document_title=document_title)
+    except Exception as e:
+        return json_response({'error': str(e)}, 500)
 
-        # Run accessibility check on remediated HTML
-        html_path = os.path.join(output_folder, result['html_file'])
-        with open(html_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+@app.route('/upload_stream', methods=['POST'])
+def upload_stream():
+    """Upload a PDF as the raw request body, skipping multipart entirely.
 
-        # Pass OCR warning if detected
-        accessibility_report = checker.check_accessibility(html_content, processor.ocr_warning)
+    Clients that can stream (curl --data-binary, fetch with a Blob) avoid
+    the multipart decode on every byte; the filename and optional title
+    come in as query parameters.
+    """
+    try:
+        filename = secure_filename(request.args.get('filename', ''))
+        if not filename:
+            return json_response({'error': 'No filename provided'}, 400)
+        if not filename.lower().endswith('.pdf'):
+            return json_response({'error': 'Only PDF files are allowed'}, 400)
 
-        # Save report data
-        report_path = os.path.join(output_folder, 'accessibility_report.json')
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(accessibility_report, f, indent=2)
-
-        # Generate HTML report
-        html_report = report_gen.generate_html_report(accessibility_report)
-        html_report_path = os.path.join(output_folder, 'accessibility_report.html')
-        with open(html_report_path, 'w', encoding='utf-8') as f:
-            f.write(html_report)
-
-        # Generate text report for download
-        text_report = report_gen.generate_text_report(accessibility_report)
-        text_report_path = os.path.join(output_folder, 'accessibility_report.txt')
-        with open(text_report_path, 'w', encoding='utf-8') as f:
-            f.write(text_report)
-
-        return jsonify({
-            'success': True,
-            'session_id': session_id,
-            'html_file': result['html_file'],
-            'pdf_file': result['pdf_file'],
-            'original_name': filename,
-            'accessibility_report': accessibility_report,
-            'has_issues': accessibility_report['issues_count'] > 0 or accessibility_report['warnings_count'] > 0
-        })
+        session_id = str(uuid.uuid4())
+        session_folder = session_path(app.config['UPLOAD_FOLDER'], session_id)
+        os.makedirs(session_folder, exist_ok=True)
+
+        input_path = os.path.join(session_folder, filename)
+        with open(input_path, 'wb') as f:
+            shutil.copyfileobj(request.stream, f, length=UPLOAD_COPY_BUFFER)
+
+        document_title = request.args.get('document_title', '').strip()
+
+        return json_response(run_remediation_pipeline(input_path, filename,
+                                                session_id, document_title))
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 @app.route('/analyze', methods=['POST'])
 def analyze_file():
     """Analyze PDF accessibility without remediation"""
     try:
         if 'file' not in request.files:
-            return jsonify({'error': 'No file provided'}), 400
+            return json_response({'error': 'No file provided'}, 400)
 
         file = request.files['file']
         if file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
+            return json_response({'error': 'No file selected'}, 400)
 
         if not file.filename.lower().endswith('.pdf'):
-            return jsonify({'error': 'Only PDF files are allowed'}), 400
+            return json_response({'error': 'Only PDF files are allowed'}, 400)
 
         # Generate unique session ID for temporary storage
         session_id = str(uuid.uuid4())
-        session_folder = os.path.join(app.config['UPLOAD_FOLDER'], session_id)
+        session_folder = session_path(app.config['UPLOAD_FOLDER'], session_id)
         os.makedirs(session_folder, exist_ok=True)
 
         # Save uploaded file
         filename = secure_filename(file.filename)
         input_path = os.path.join(session_folder, filename)
-        file.save(input_path)
+        save_upload(file, input_path)
 
         # Convert PDF to HTML (without remediation)
         html_content, extracted_styles = processor.pdf_to_html_with_styles(input_path)
 
         # Run accessibility check on ORIGINAL HTML (before remediation)
-        accessibility_report = checker.check_accessibility(html_content, processor.ocr_warning)
+        accessibility_report = checker.check_accessibility(html_content, processor.ocr_warning).to_dict()
 
         # Clean up temporary files
         shutil.rmtree(session_folder)
 
-        return jsonify({
+        return json_response({
             'success': True,
             'accessibility_report': accessibility_report,
             'message': 'Analysis complete. Review issues before proceeding with remediation.'
         })
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 @app.route('/download/<session_id>/<file_type>')
 def download_file(session_id, file_type):
     try:
-        output_folder = os.path.join(app.config['OUTPUT_FOLDER'], session_id)
+        # Make sure any debounced fix writes have landed before serving
+        _flush_pending(session_id)
 
-        # Find the actual files (they use original filename + _remediated)
+        output_folder = session_path(app.config['OUTPUT_FOLDER'], session_id)
+
+        # Resolve output paths from the session cache when warm; scan the
+        # folder only for sessions that outlived the cache (restart, LRU)
         if file_type == 'html':
-            # Find HTML file
-            html_files = [f for f in os.listdir(output_folder) if f.endswith('_remediated.html')]
-            if not html_files:
-                return jsonify({'error': 'HTML file not found'}), 404
-            file_path = os.path.join(output_folder, html_files[0])
+            file_path = (_session_cache_get(session_id, 'html_path')
+                         or _find_output_file(output_folder, '_remediated.html'))
+            if file_path is None:
+                return json_response({'error': 'HTML file not found'}, 404)
             mimetype = 'text/html'
-            download_name = html_files[0]
+            download_name = os.path.basename(file_path)
         elif file_type == 'pdf':
-            # Find PDF file
-            pdf_files = [f for f in os.listdir(output_folder) if f.endswith('_remediated.pdf')]
-            if not pdf_files:
-                return jsonify({'error': 'PDF file not found'}), 404
-            file_path = os.path.join(output_folder, pdf_files[0])
+            file_path = (_session_cache_get(session_id, 'pdf_path')
+                         or _find_output_file(output_folder, '_remediated.pdf'))
+            if file_path is None:
+                return json_response({'error': 'PDF file not found'}, 404)
             mimetype = 'application/pdf'
-            download_name = pdf_files[0]
+            download_name = os.path.basename(file_path)
         elif file_type == 'report_txt':
             file_path = os.path.join(output_folder, 'accessibility_report.txt')
             mimetype = 'text/plain'
             download_name = 'accessibility_report.txt'
         else:
-            return jsonify({'error': 'Invalid file type'}), 400
+            return json_response({'error': 'Invalid file type'}, 400)
 
         if not os.path.exists(file_path):
-            return jsonify({'error': 'File not found'}), 404
+            return json_response({'error': 'File not found'}, 404)
 
-        return send_file(file_path, mimetype=mimetype, as_attachment=True, download_name=download_name)
+        # conditional=True wraps the file in a FileWrapper the WSGI server
+        # can hand off to sendfile(2), and enables Range/If-Modified-Since
+        return send_file(file_path, mimetype=mimetype, as_attachment=True,
+                         download_name=download_name, conditional=True)
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
+
+# Reports past this size are streamed from disk in chunks instead of
+# being cached whole in memory
+REPORT_STREAM_THRESHOLD = 1 << 20
+REPORT_STREAM_CHUNK = 64 * 1024
+
+
+def _stream_file(path, chunk_size=REPORT_STREAM_CHUNK):
+    """Yield a file's bytes in fixed-size chunks."""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+@lru_cache(maxsize=256)
+def _report_html(session_id, mtime):
+    """HTML report body for a session; mtime in the key invalidates the
+    cached copy whenever the report file is rewritten."""
+    report_path = os.path.join(session_path(app.config['OUTPUT_FOLDER'], session_id),
+                               'accessibility_report.html')
+    with open(report_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
 
 @app.route('/report/<session_id>')
 def view_report(session_id):
     try:
-        output_folder = os.path.join(app.config['OUTPUT_FOLDER'], session_id)
+        output_folder = session_path(app.config['OUTPUT_FOLDER'], session_id)
         report_path = os.path.join(output_folder, 'accessibility_report.html')
 
         if not os.path.exists(report_path):
-            return jsonify({'error': 'Report not found'}), 404
+            return json_response({'error': 'Report not found'}, 404)
 
-        with open(report_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        # Large reports are streamed in 64 KiB chunks rather than held in
+        # the process-wide cache; small ones stay on the cached fast path
+        if os.path.getsize(report_path) > REPORT_STREAM_THRESHOLD:
+            return Response(stream_with_context(_stream_file(report_path)),
+                            mimetype='text/html')
+
+        html_content = _report_html(session_id, os.path.getmtime(report_path))
 
         return Response(html_content, mimetype='text/html')
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 @app.route('/remediate/<session_id>')
 def interactive_remediate(session_id):
     """Show interactive remediation page"""
     try:
-        output_folder = os.path.join(app.config['OUTPUT_FOLDER'], session_id)
+        output_folder = session_path(app.config['OUTPUT_FOLDER'], session_id)
         report_path = os.path.join(output_folder, 'accessibility_report.json')
 
         if not os.path.exists(report_path):
-            return jsonify({'error': 'Session not found'}), 404
+            return json_response({'error': 'Session not found'}, 404)
 
         return render_template('remediate.html', session_id=session_id)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
+
+@lru_cache(maxsize=256)
+def _issues_payload(session_id, mtime):
+    """Serialized /api/issues body for a session.
+
+    The remediation UI polls this endpoint, so the parse-and-reshape
+    work is done once per report version; the file mtime in the cache
+    key rolls the entry over whenever fix_issue rewrites the report.
+    """
+    report_path = os.path.join(session_path(app.config['OUTPUT_FOLDER'], session_id),
+                               'accessibility_report.json')
+    with open(report_path, 'rb') as f:
+        report = _json_loads(f.read())
+
+    # Convert report issues to interactive format
+    issues = []
+    issue_id = 0
+
+    for issue in report.get('issues', []):
+        issues.append({
+            'id': issue_id,
+            'type': issue.get('type', 'unknown'),
+            'title': issue['title'],
+            'description': issue['description'],
+            'remediation': issue['remediation'],
+            'severity': 'critical',
+            'guidelines': [issue['guideline']],
+            'element_preview': issue.get('element', '')
+        })
+        issue_id += 1
+
+    for warning in report.get('warnings', []):
+        issues.append({
+            'id': issue_id,
+            'type': warning.get('type', 'unknown'),
+            'title': warning['title'],
+            'description': warning['description'],
+            'remediation': warning['remediation'],
+            'severity': 'warning',
+            'guidelines': [warning['guideline']],
+            'element_preview': warning.get('element', '')
+        })
+        issue_id += 1
+
+    return _json_dumps_bytes({
+        'success': True,
+        'issues': issues,
+        'total': len(issues)
+    })
+
 
 @app.route('/api/issues/<session_id>')
 def get_issues(session_id):
     """Get list of accessibility issues for interactive remediation"""
     try:
-        output_folder = os.path.join(app.config['OUTPUT_FOLDER'], session_id)
+        output_folder = session_path(app.config['OUTPUT_FOLDER'], session_id)
         report_path = os.path.join(output_folder, 'accessibility_report.json')
 
         if not os.path.exists(report_path):
-            return jsonify({'error': 'Report not found'}), 404
-
-        with open(report_path, 'r', encoding='utf-8') as f:
-            report = json.load(f)
-
-        # Convert report issues to interactive format
-        issues = []
-        issue_id = 0
-
-        for issue in report.get('issues', []):
-            issues.append({
-                'id': issue_id,
-                'type': issue.get('type', 'unknown'),
-                'title': issue['title'],
-                'description': issue['description'],
-                'remediation': issue['remediation'],
-                'severity': 'critical',
-                'guidelines': [issue['guideline']],
-                'element_preview': issue.get('element', '')
-            })
-            issue_id += 1
-
-        for warning in report.get('warnings', []):
-            issues.append({
-                'id': issue_id,
-                'type': warning.get('type', 'unknown'),
-                'title': warning['title'],
-                'description': warning['description'],
-                'remediation': warning['remediation'],
-                'severity': 'warning',
-                'guidelines': [warning['guideline']],
-                'element_preview': warning.get('element', '')
-            })
-            issue_id += 1
-
-        return jsonify({
-            'success': True,
-            'issues': issues,
-            'total': len(issues)
-        })
+            return json_response({'error': 'Report not found'}, 404)
+
+        payload = _issues_payload(session_id, os.path.getmtime(report_path))
+        return Response(payload, mimetype='application/json')
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
+
+def _apply_fixes(session_id, issue_types):
+    """Apply a sequence of fixes to a session's HTML in one pass.
+
+    The expensive steps — accessibility re-check, report write, and the
+    debounced HTML/PDF flush — run once regardless of how many issue
+    types are in the batch.
+    """
+    output_folder = session_path(app.config['OUTPUT_FOLDER'], session_id)
+
+    # Use the in-memory copy when the session is warm; fall back to
+    # the directory scan and file read otherwise
+    html_path = _session_cache_get(session_id, 'html_path')
+    html_content = _session_cache_get(session_id, 'html')
+    if html_path is None:
+        # Find the actual HTML file (uses original filename + _remediated)
+        html_path = _find_output_file(output_folder, '_remediated.html')
+        if html_path is None:
+            return {'error': 'HTML file not found'}, 404
+    if html_content is None:
+        # Read current HTML
+        with open(html_path, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+
+    # Apply fixes in memory, in order
+    fixed_html = html_content
+    for issue_type in issue_types:
+        fixed_html = processor.apply_specific_fix(fixed_html, issue_type)
+
+    # The in-memory copy is canonical between fixes; later reads come
+    # from the session cache
+    _session_cache_put(session_id, html=fixed_html, html_path=html_path)
+
+    # Re-run accessibility check
+    accessibility_report = checker.check_accessibility(fixed_html).to_dict()
+
+    # Save updated report (synchronously: its mtime invalidates the
+    # /api/issues cache)
+    report_path = os.path.join(output_folder, 'accessibility_report.json')
+    with open(report_path, 'wb') as f:
+        f.write(_json_dumps_pretty(accessibility_report))
+
+    _session_cache_put(session_id, report=accessibility_report)
+
+    # Debounce the HTML write and PDF re-render: a burst of fixes
+    # pays that cost once, after the last one
+    _schedule_flush(session_id, html_path, output_folder)
+
+    return {
+        'success': True,
+        'fixed_count': len(issue_types),
+        'new_compliance_score': accessibility_report['compliance_score']
+    }, 200
 
 @app.route('/api/fix-issue/<session_id>', methods=['POST'])
 def fix_issue(session_id):
@@ -273,64 +740,60 @@ def fix_issue(session_id):
         data = request.json
         issue_type = data.get('issue_type')
 
-        output_folder = os.path.join(app.config['OUTPUT_FOLDER'], session_id)
-
-        # Find the actual HTML file (uses original filename + _remediated)
-        html_files = [f for f in os.listdir(output_folder) if f.endswith('_remediated.html')]
-        if not html_files:
-            return jsonify({'error': 'HTML file not found'}), 404
-
-        html_path = os.path.join(output_folder, html_files[0])
-
-        # Read current HTML
-        with open(html_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-
-        # Apply specific fix based on issue type
-        fixed_html = processor.apply_specific_fix(html_content, issue_type)
-
-        # Save updated HTML
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(fixed_html)
+        payload, status = _apply_fixes(session_id, [issue_type])
+        if status == 200:
+            payload = dict(payload, message='Issue fixed successfully')
+        return json_response(payload, status)
 
-        # Regenerate PDF with fixed HTML using browser rendering
-        pdf_files = [f for f in os.listdir(output_folder) if f.endswith('_remediated.pdf')]
-        if pdf_files:
-            pdf_path = os.path.join(output_folder, pdf_files[0])
-            processor.html_to_pdf_with_browser(fixed_html, pdf_path)
+    except Exception as e:
+        return json_response({'error': str(e)}, 500)
 
-        # Re-run accessibility check
-        accessibility_report = checker.check_accessibility(fixed_html)
+@app.route('/api/fix-issues/<session_id>', methods=['POST'])
+def fix_issues(session_id):
+    """Auto-fix a batch of accessibility issues in one document pass.
 
-        # Save updated report
-        report_path = os.path.join(output_folder, 'accessibility_report.json')
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(accessibility_report, f, indent=2)
+    Fixing N issues one HTTP call at a time re-rendered the PDF and
+    re-ran the checker N times; this endpoint takes
+    {"issue_types": [...]} and pays those costs once for the batch.
+    """
+    try:
+        data = request.json
+        issue_types = data.get('issue_types') or []
+        if not issue_types:
+            return json_response({'error': 'No issue types provided'}, 400)
 
-        return jsonify({
-            'success': True,
-            'message': 'Issue fixed successfully',
-            'new_compliance_score': accessibility_report['compliance_score']
-        })
+        payload, status = _apply_fixes(session_id, issue_types)
+        if status == 200:
+            payload = dict(payload,
+                           message=f'{len(issue_types)} issues fixed successfully')
+        return json_response(payload, status)
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 @app.route('/cleanup/<session_id>', methods=['POST'])
 def cleanup(session_id):
     try:
         # Clean up session files
-        upload_folder = os.path.join(app.config['UPLOAD_FOLDER'], session_id)
-        output_folder = os.path.join(app.config['OUTPUT_FOLDER'], session_id)
+        upload_folder = session_path(app.config['UPLOAD_FOLDER'], session_id)
+        output_folder = session_path(app.config['OUTPUT_FOLDER'], session_id)
 
         if os.path.exists(upload_folder):
             shutil.rmtree(upload_folder)
         if os.path.exists(output_folder):
             shutil.rmtree(output_folder)
 
-        return jsonify({'success': True})
+        with _flush_lock:
+            entry = _flush_timers.pop(session_id, None)
+            if entry is not None:
+                entry[0].cancel()
+
+        with _session_lock:
+            SESSION_CACHE.pop(session_id, None)
+
+        return json_response({'success': True})
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 @app.route('/deploy')
 def deploy_guide():
@@ -363,7 +826,7 @@ def deployment_docs():
             content = f.read()
             return f'<pre style="padding: 20px; max-width: 1000px; margin: 0 auto;">{content}</pre>'
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 @app.route('/api/server-info')
 def server_info():
@@ -386,14 +849,14 @@ def server_info():
         port = 8080
         url = f'http://{ip_address}:{port}'
 
-        return jsonify({
+        return json_response({
             'success': True,
             'ip': ip_address,
             'port': port,
             'url': url
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=8080)
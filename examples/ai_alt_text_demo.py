@@ -20,7 +20,11 @@ This will:
 - Display cost summary
 """
 
+import io
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool, cpu_count
 from pathlib import Path
 import os
 
@@ -49,50 +53,98 @@ except ImportError:
     print("Install with: pip install Pillow")
     sys.exit(1)
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
-def extract_images_from_pdf(pdf_path: Path) -> list:
-    """Extract all images from a PDF."""
+
+def _extract_page_images(args) -> tuple:
+    """Extract the images on one page; runs in a worker process.
+
+    Workers re-open the PDF by path — pikepdf objects don't cross the
+    process boundary, only plain dicts of image bytes come back. Log
+    lines are returned so the parent prints them in page order.
+    """
+    pdf_path, page_num = args
     images = []
+    log_lines = []
+
+    with Pdf.open(pdf_path) as pdf:
+        page = pdf.pages[page_num - 1]
+        if '/Resources' not in page or '/XObject' not in page.Resources:
+            return images, log_lines
+
+        xobjects = page.Resources.XObject
+
+        for obj_name in xobjects.keys():
+            obj = xobjects[obj_name]
+
+            if obj.get('/Subtype') == '/Image':
+                try:
+                    width = obj.get('/Width', 0)
+                    height = obj.get('/Height', 0)
+
+                    filters = obj.get('/Filter')
+                    if isinstance(filters, pikepdf.Array):
+                        filter_names = [str(f) for f in filters]
+                    elif filters is not None:
+                        filter_names = [str(filters)]
+                    else:
+                        filter_names = []
+
+                    if filter_names == ['/DCTDecode']:
+                        # JPEG-native XObject (the common case in content
+                        # PDFs): the stream already is a JPEG, so skip the
+                        # full decode + PNG re-encode and ship it as-is
+                        img_bytes_data = obj.read_raw_bytes()
+                    else:
+                        # Decode and re-encode; fast PNG settings, since
+                        # the bytes feed an AI call, not an archive
+                        pil_image = PdfImage(obj).as_pil_image()
+                        img_bytes = io.BytesIO()
+                        pil_image.save(img_bytes, format='PNG',
+                                       optimize=False, compress_level=1)
+                        img_bytes_data = img_bytes.getvalue()
 
-    try:
-        pdf = Pdf.open(pdf_path)
+                    images.append({
+                        'name': str(obj_name),
+                        'page': page_num,
+                        'width': width,
+                        'height': height,
+                        'bytes': img_bytes_data
+                    })
 
-        for page_num, page in enumerate(pdf.pages, 1):
-            if '/Resources' not in page or '/XObject' not in page.Resources:
-                continue
+                    log_lines.append(f"  ✓ Extracted {obj_name} from page {page_num} ({width}x{height})")
 
-            xobjects = page.Resources.XObject
+                except Exception as e:
+                    log_lines.append(f"  ✗ Could not extract {obj_name}: {e}")
 
-            for obj_name in xobjects.keys():
-                obj = xobjects[obj_name]
+    return images, log_lines
 
-                if obj.get('/Subtype') == '/Image':
-                    try:
-                        # Extract image
-                        pdf_image = PdfImage(obj)
-                        pil_image = pdf_image.as_pil_image()
 
-                        # Convert to bytes
-                        import io
-                        img_bytes = io.BytesIO()
-                        pil_image.save(img_bytes, format='PNG')
-                        img_bytes_data = img_bytes.getvalue()
+def extract_images_from_pdf(pdf_path: Path) -> list:
+    """Extract all images from a PDF, fanning pages out across processes."""
+    images = []
 
-                        images.append({
-                            'name': str(obj_name),
-                            'page': page_num,
-                            'width': obj.get('/Width', 0),
-                            'height': obj.get('/Height', 0),
-                            'image': pil_image,
-                            'bytes': img_bytes_data
-                        })
+    try:
+        with Pdf.open(pdf_path) as pdf:
+            num_pages = len(pdf.pages)
 
-                        print(f"  ✓ Extracted {obj_name} from page {page_num} ({pil_image.size[0]}x{pil_image.size[1]})")
+        if num_pages == 0:
+            return images
 
-                    except Exception as e:
-                        print(f"  ✗ Could not extract {obj_name}: {e}")
+        # Image decode + PNG encode is CPU-bound and independent per
+        # page, so pages map cleanly onto a small worker pool
+        jobs = [(str(pdf_path), page_num) for page_num in range(1, num_pages + 1)]
+        with Pool(min(cpu_count() or 1, 4)) as pool:
+            page_results = pool.map(_extract_page_images, jobs)
 
-        pdf.close()
+        for page_images, log_lines in page_results:
+            for line in log_lines:
+                print(line)
+            images.extend(page_images)
 
     except Exception as e:
         print(f"Error opening PDF: {e}")
@@ -100,6 +152,26 @@ def extract_images_from_pdf(pdf_path: Path) -> list:
     return images
 
 
+# Preview writes are pure I/O; a small pool lets them land while the
+# user answers prompts instead of blocking the walk on each one
+PREVIEW_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+def _write_preview(path: str, data: bytes):
+    """Write one image preview file; runs on the preview pool."""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def save_preview(img_data: dict) -> str:
+    """Queue a terminal-preview file write and return its path at once."""
+    suffix = '.png' if img_data['bytes'][:4] == b'\x89PNG' else '.jpg'
+    tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    tmp.close()
+    PREVIEW_POOL.submit(_write_preview, tmp.name, img_data['bytes'])
+    return tmp.name
+
+
 def display_image_info(img_data: dict):
     """Display information about an image."""
     print("\n" + "=" * 70)
@@ -109,34 +181,63 @@ def display_image_info(img_data: dict):
     print("=" * 70)
 
 
-def demo_heuristic_detection(img_data: dict):
-    """Show heuristic decorative detection."""
+def _classify_one(img_data: dict) -> tuple:
+    """Heuristic rules for one image (same as pdf_remediator.py)."""
     width = img_data['width']
     height = img_data['height']
 
-    # Heuristic rules (same as pdf_remediator.py)
-    is_decorative = False
-    reason = ""
-
     if width < 20 or height < 20:
-        is_decorative = True
-        reason = "Very small image (< 20px)"
-    elif width * height < 400:
-        is_decorative = True
-        reason = "Small area (< 400px total)"
-    else:
-        aspect_ratio = width / height if height > 0 else 0
-        if aspect_ratio > 20 or aspect_ratio < 0.05:
-            is_decorative = True
-            reason = f"Extreme aspect ratio ({aspect_ratio:.2f})"
-
+        return True, "Very small image (< 20px)"
+    if width * height < 400:
+        return True, "Small area (< 400px total)"
+    aspect_ratio = width / height if height > 0 else 0
+    if aspect_ratio > 20 or aspect_ratio < 0.05:
+        return True, f"Extreme aspect ratio ({aspect_ratio:.2f})"
+    return False, ""
+
+
+def classify_decorative(images: list) -> list:
+    """Classify every image as decorative or not in a single pass.
+
+    Returns a list of (is_decorative, reason) tuples aligned with the
+    input. With NumPy present the thresholds run as a handful of
+    vectorized comparisons over the whole set instead of a Python
+    if/elif cascade per image; the fallback loop applies the same rules.
+    """
+    if not (NUMPY_AVAILABLE and images):
+        return [_classify_one(img) for img in images]
+
+    w = np.fromiter((int(img['width']) for img in images),
+                    dtype=np.int64, count=len(images))
+    h = np.fromiter((int(img['height']) for img in images),
+                    dtype=np.int64, count=len(images))
+    small = (w < 20) | (h < 20)
+    tiny = (w * h) < 400
+    ratio = w / np.maximum(h, 1)
+    extreme = (ratio > 20) | (ratio < 0.05)
+
+    # Reasons are display-only, so only the flagged minority pays for
+    # string formatting; the classification itself is the NumPy kernels
+    results = []
+    for i in range(len(images)):
+        if small[i]:
+            results.append((True, "Very small image (< 20px)"))
+        elif tiny[i]:
+            results.append((True, "Small area (< 400px total)"))
+        elif extreme[i]:
+            results.append((True, f"Extreme aspect ratio ({ratio[i]:.2f})"))
+        else:
+            results.append((False, ""))
+    return results
+
+
+def demo_heuristic_detection(is_decorative: bool, reason: str):
+    """Show the precomputed heuristic decorative detection."""
     print(f"\nHeuristic Detection:")
     print(f"  Decorative: {is_decorative}")
     if reason:
         print(f"  Reason: {reason}")
 
-    return is_decorative
-
 
 def get_page_context(page_num: int) -> str:
     """Get page context from user (in real use, would extract from PDF)."""
@@ -158,33 +259,18 @@ def get_page_context(page_num: int) -> str:
     return context
 
 
-def demo_ai_generation(generator: AIAltTextGenerator, img_data: dict, page_context: str):
-    """Demonstrate AI alt-text generation."""
-    print(f"\n🤖 Generating AI alt-text...")
-
-    try:
-        result = generator.generate_alt_text(
-            img_data['bytes'],
-            page_context=page_context,
-            use_cache=True
-        )
-
-        print(f"\n✓ AI Analysis Complete:")
-        print(f"  Provider: {result.provider}")
-        print(f"  Decorative: {result.is_decorative}")
-        if not result.is_decorative:
-            print(f"  Alt-text: \"{result.alt_text}\"")
-        print(f"  Reasoning: {result.reasoning}")
-        print(f"  Confidence: {result.confidence:.0%}")
-        print(f"  Cost: ${result.cost:.4f}")
-        if result.cached:
-            print(f"  (Cached result)")
-
-        return result
-
-    except Exception as e:
-        print(f"\n✗ Error: {e}")
-        return None
+def show_ai_result(img_data: dict, result: AltTextResult):
+    """Print one image's AI analysis."""
+    print(f"\n✓ {img_data['name']} (Page {img_data['page']}):")
+    print(f"  Provider: {result.provider}")
+    print(f"  Decorative: {result.is_decorative}")
+    if not result.is_decorative:
+        print(f"  Alt-text: \"{result.alt_text}\"")
+    print(f"  Reasoning: {result.reasoning}")
+    print(f"  Confidence: {result.confidence:.0%}")
+    print(f"  Cost: ${result.cost:.4f}")
+    if result.cached:
+        print(f"  (Cached result)")
 
 
 def run_demo(pdf_path: Path):
@@ -238,54 +324,95 @@ def run_demo(pdf_path: Path):
     try:
         generator = AIAltTextGenerator(config)
         print(f"  ✓ Using provider: {config['provider']}")
+        # Results persist across runs: re-running the demo on the same
+        # PDF answers from this cache instead of re-paying the API
+        print(f"  ✓ Result cache: {generator.cache.db_file}")
     except Exception as e:
         print(f"  ✗ Error: {e}")
         return
 
-    # Process each image
-    results = []
+    # Classify the whole set up front (one vectorized pass when NumPy is
+    # available), then walk the images interactively; the network calls
+    # fan out afterwards so they overlap instead of running one at a time
+    heuristics = classify_decorative(images)
+    selected = []
+    page_contexts = {}
 
     for idx, img_data in enumerate(images, 1):
         display_image_info(img_data)
 
         # Try to display image (if in terminal with image support)
         try:
-            # For terminals that support images (iTerm2, etc.)
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                img_data['image'].save(tmp.name)
-                print(f"\n[Image saved to: {tmp.name}]")
-                # In a real GUI, would display the image here
+            # For terminals that support images (iTerm2, etc.); the write
+            # itself completes in the background while we prompt the user
+            preview_path = save_preview(img_data)
+            print(f"\n[Image saved to: {preview_path}]")
+            # In a real GUI, would display the image here
         except:
             pass
 
         # Show heuristic detection
-        heuristic_decorative = demo_heuristic_detection(img_data)
+        heuristic_decorative, heuristic_reason = heuristics[idx - 1]
+        demo_heuristic_detection(heuristic_decorative, heuristic_reason)
 
-        # Get page context
-        page_context = get_page_context(img_data['page'])
+        # Get page context (asked once per page)
+        if img_data['page'] not in page_contexts:
+            page_contexts[img_data['page']] = get_page_context(img_data['page'])
 
-        # Generate AI alt-text
-        result = demo_ai_generation(generator, img_data, page_context)
-
-        if result:
-            results.append({
-                'image': img_data['name'],
-                'page': img_data['page'],
-                'heuristic_decorative': heuristic_decorative,
-                'ai_decorative': result.is_decorative,
-                'alt_text': result.alt_text,
-                'cost': result.cost,
-                'provider': result.provider
-            })
+        selected.append((img_data, heuristic_decorative, heuristic_reason))
 
         # Ask to continue
         if idx < len(images):
-            print(f"\n[{idx}/{len(images)} images processed]")
+            print(f"\n[{idx}/{len(images)} images selected]")
             cont = input("Continue to next image? (y/n): ").lower()
             if cont != 'y':
                 break
 
+    # Generate AI alt-text only for images the heuristics didn't already
+    # mark decorative — those get a zero-cost synthesized result — and
+    # fan the remainder out concurrently in one batch call
+    results = []
+    needs_ai = [entry for entry in selected if not entry[1]]
+    print(f"\n🤖 Generating AI alt-text for {len(needs_ai)} of "
+          f"{len(selected)} images ({len(selected) - len(needs_ai)} "
+          f"skipped as decorative)...")
+    try:
+        batch_items = [(img_data['bytes'], page_contexts.get(img_data['page'], ''))
+                       for img_data, _, _ in needs_ai]
+        ai_results = iter(generator.generate_alt_text_batch(batch_items,
+                                                            concurrency=8))
+    except Exception as e:
+        print(f"\n✗ Error: {e}")
+        ai_results = iter([])
+
+    batch_results = []
+    for img_data, heuristic_decorative, heuristic_reason in selected:
+        if heuristic_decorative:
+            batch_results.append(AltTextResult(
+                is_decorative=True,
+                alt_text="",
+                reasoning=f"Heuristic: {heuristic_reason}",
+                confidence=0.9,
+                provider='heuristic',
+                cost=0.0
+            ))
+        else:
+            batch_results.append(next(ai_results, None))
+
+    for (img_data, heuristic_decorative, _), result in zip(selected, batch_results):
+        if result is None:
+            continue
+        show_ai_result(img_data, result)
+        results.append({
+            'image': img_data['name'],
+            'page': img_data['page'],
+            'heuristic_decorative': heuristic_decorative,
+            'ai_decorative': result.is_decorative,
+            'alt_text': result.alt_text,
+            'cost': result.cost,
+            'provider': result.provider
+        })
+
     # Summary
     print("\n" + "=" * 70)
     print("SUMMARY")
@@ -28,6 +28,10 @@ def main():
         print("\nAnalyzing images...")
         images = remediator.analyze_images()
 
+        # One dict built once makes every later lookup O(1) instead of a
+        # linear scan over the image list
+        images_by_name = {img.name: img for img in images}
+
         print(f"Found {len(images)} images:")
         for img in images:
             decorative = "Decorative" if img.is_decorative else "Descriptive"
@@ -50,7 +54,7 @@ def main():
         print("\nApplying custom alt text...")
         for img_name, alt_text in custom_alt_text.items():
             # Check if this image exists in the PDF
-            matching_img = next((img for img in images if img.name == img_name), None)
+            matching_img = images_by_name.get(img_name)
 
             if matching_img:
                 if not matching_img.is_decorative:
@@ -66,7 +70,7 @@ def main():
 
         print("\nMarking decorative images...")
         for img_name in decorative_images:
-            matching_img = next((img for img in images if img.name == img_name), None)
+            matching_img = images_by_name.get(img_name)
             if matching_img:
                 remediator.mark_image_decorative(img_name)
                 print(f"  ✓ {img_name}: Marked as decorative")
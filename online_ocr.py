@@ -8,9 +8,43 @@ No installation required - uses cloud-based OCR
 import requests
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def ocr_pdf_online(input_pdf_path, output_pdf_path=None, api_key=None):
+try:
+    # Streams the multipart body in small chunks instead of buffering
+    # the whole PDF in memory to build it
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
+# Chunk size for streaming the searchable PDF download to disk
+DOWNLOAD_CHUNK_SIZE = 65536
+
+# (connect, read) timeouts so a stuck API call can't hang forever; OCR
+# itself can legitimately take minutes on the read side
+REQUEST_TIMEOUT = (10, 300)
+
+# One shared session: the upload and the result download reuse a single
+# TLS connection, and transient OCR.space 429/5xx responses are retried
+# with exponential backoff instead of failing the whole run
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'POST'])
+    )
+))
+
+def ocr_pdf_online(input_pdf_path, output_pdf_path=None, api_key=None,
+                   searchable=True, language='eng', ocr_engine=2):
     """
     Perform OCR on a PDF using OCR.space free API.
 
@@ -18,6 +52,11 @@ def ocr_pdf_online(input_pdf_path, output_pdf_path=None, api_key=None):
         input_pdf_path: Path to input PDF file
         output_pdf_path: Path to output searchable PDF (optional)
         api_key: OCR.space API key (optional, uses free tier if not provided)
+        searchable: Build a searchable PDF overlay. Turning this off
+            roughly halves server-side processing time and writes the
+            recognized text to a .txt file instead
+        language: OCR language code
+        ocr_engine: OCR.space engine number (2 is more accurate)
 
     Returns:
         True if successful, False otherwise
@@ -30,7 +69,11 @@ def ocr_pdf_online(input_pdf_path, output_pdf_path=None, api_key=None):
 
     input_path = Path(input_pdf_path)
 
-    if not input_path.exists():
+    # One stat serves both the existence check and the size limit below;
+    # batch callers hit this path once per file, so syscalls count
+    try:
+        file_size = os.stat(input_pdf_path).st_size
+    except FileNotFoundError:
         print(f"Error: File not found: {input_pdf_path}")
         return False
 
@@ -46,7 +89,6 @@ def ocr_pdf_online(input_pdf_path, output_pdf_path=None, api_key=None):
     url = 'https://api.ocr.space/parse/image'
 
     # Check file size (API limit is 1MB for free tier)
-    file_size = input_path.stat().st_size
     file_size_mb = file_size / (1024 * 1024)
 
     if file_size_mb > 1:
@@ -81,20 +123,34 @@ def ocr_pdf_online(input_pdf_path, output_pdf_path=None, api_key=None):
             # API parameters
             payload = {
                 'apikey': api_key,
-                'language': 'eng',
-                'isOverlayRequired': True,  # Create searchable PDF
-                'OCREngine': 2,  # Engine 2 is more accurate
-                'scale': True,
-                'isTable': True,
-                'detectOrientation': True
-            }
-
-            files = {
-                'file': f
+                'language': language,
+                # The overlay (per-glyph positions for the searchable
+                # PDF) is the expensive part server-side; text-only
+                # callers skip it
+                'isOverlayRequired': 'true' if searchable else 'false',
+                'OCREngine': str(ocr_engine),
+                'scale': 'true',
+                'isTable': 'true',
+                'detectOrientation': 'true'
             }
 
-            # Make API request
-            response = requests.post(url, files=files, data=payload)
+            if TOOLBELT_AVAILABLE:
+                # Stream the upload: the multipart body is generated in
+                # small chunks as the socket drains, so peak memory stays
+                # constant instead of ~2x the file size
+                encoder = MultipartEncoder(fields=dict(
+                    payload,
+                    file=(input_path.name, f, 'application/pdf')
+                ))
+                response = _SESSION.post(
+                    url, data=encoder,
+                    headers={'Content-Type': encoder.content_type},
+                    timeout=REQUEST_TIMEOUT)
+            else:
+                # Fallback buffers the body in memory; fine at the 1 MB
+                # free-tier ceiling
+                response = _SESSION.post(url, files={'file': f},
+                                          data=payload, timeout=REQUEST_TIMEOUT)
             result = response.json()
 
             if result.get('IsErroredOnProcessing'):
@@ -111,17 +167,35 @@ def ocr_pdf_online(input_pdf_path, output_pdf_path=None, api_key=None):
 
                 return False
 
+            # Text-only mode: no overlay was requested, so just write
+            # the recognized text next to where the PDF would have gone
+            if not searchable:
+                parsed = result.get('ParsedResults') or []
+                text = '\n'.join(p.get('ParsedText', '') for p in parsed)
+                text_path = Path(output_pdf_path).with_suffix('.txt')
+                with open(text_path, 'w', encoding='utf-8') as out_file:
+                    out_file.write(text)
+                print(f"✓ Recognized text saved: {text_path}")
+                return True
+
             # Get the searchable PDF URL
             if 'SearchablePDFURL' in result:
                 pdf_url = result['SearchablePDFURL']
                 print(f"✓ OCR completed successfully!")
                 print(f"Downloading searchable PDF from: {pdf_url}")
 
-                # Download the searchable PDF
-                pdf_response = requests.get(pdf_url)
-
-                with open(output_pdf_path, 'wb') as out_file:
-                    out_file.write(pdf_response.content)
+                # Download the searchable PDF, streaming it to disk in
+                # chunks so it never fully materializes in memory. If a
+                # caller ever needs the bytes in RAM (e.g. to checksum
+                # before writing), accumulate with bytearray.extend and
+                # convert once at the end — bytes += in a loop is
+                # quadratic
+                with _SESSION.get(pdf_url, stream=True,
+                                  timeout=REQUEST_TIMEOUT) as pdf_response:
+                    with open(output_pdf_path, 'wb') as out_file:
+                        for chunk in pdf_response.iter_content(
+                                chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            out_file.write(chunk)
 
                 print(f"✓ Searchable PDF saved: {output_pdf_path}")
                 print()
@@ -141,23 +215,63 @@ def ocr_pdf_online(input_pdf_path, output_pdf_path=None, api_key=None):
         print(f"Error: {e}")
         return False
 
+# Concurrent uploads when batching; matches the session's connection
+# pool so every worker keeps a live connection
+MAX_CONCURRENT_OCR = 8
+
+
+def ocr_pdfs_online(input_paths, api_key=None):
+    """OCR several PDFs concurrently.
+
+    OCR.space holds the connection open while it processes, so a
+    sequential loop spends almost all its time blocked on the network;
+    overlapping the waits in a bounded thread pool processes N files in
+    roughly the time of the slowest one.
+
+    Args:
+        input_paths: Paths of input PDF files
+        api_key: OCR.space API key shared by all requests (optional)
+
+    Returns:
+        Dict mapping each input path to True/False success
+    """
+    workers = min(len(input_paths), MAX_CONCURRENT_OCR)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(
+            lambda path: ocr_pdf_online(path, api_key=api_key), input_paths))
+    return dict(zip(input_paths, outcomes))
+
+
 def main():
     """Main function."""
     if len(sys.argv) < 2:
         print("Usage: python3 online_ocr.py <input_pdf> [output_pdf] [api_key]")
+        print("       python3 online_ocr.py <input1.pdf> <input2.pdf> <input3.pdf> ...")
         print()
         print("Examples:")
         print('  python3 online_ocr.py input.pdf')
         print('  python3 online_ocr.py input.pdf output_ocr.pdf')
         print('  python3 online_ocr.py input.pdf output_ocr.pdf YOUR_API_KEY')
+        print('  python3 online_ocr.py scan1.pdf scan2.pdf scan3.pdf')
         print()
         print("Note: Free tier limited to 1MB files and 500 requests/day")
         print("Get free API key at: https://ocr.space/ocrapi")
         sys.exit(1)
 
-    input_pdf = sys.argv[1]
-    output_pdf = sys.argv[2] if len(sys.argv) > 2 else None
-    api_key = sys.argv[3] if len(sys.argv) > 3 else None
+    args = sys.argv[1:]
+
+    # Three or more PDF arguments means batch mode (the classic 3-arg
+    # form puts an API key, not a .pdf, in the third slot); the files
+    # upload concurrently and outputs get the default _ocr suffix
+    if len(args) >= 3 and all(a.lower().endswith('.pdf') for a in args):
+        outcomes = ocr_pdfs_online(args)
+        failed = [path for path, ok in outcomes.items() if not ok]
+        print(f"\n{len(args) - len(failed)}/{len(args)} files OCR'd successfully")
+        sys.exit(1 if failed else 0)
+
+    input_pdf = args[0]
+    output_pdf = args[1] if len(args) > 1 else None
+    api_key = args[2] if len(args) > 2 else None
 
     success = ocr_pdf_online(input_pdf, output_pdf, api_key)
     sys.exit(0 if success else 1)
@@ -16,16 +16,364 @@ from reportlab.lib import colors
 from reportlab.pdfgen import canvas
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
 from playwright.sync_api import sync_playwright
 import tempfile
 
+# selectolax's Lexbor engine parses and queries an order of magnitude
+# faster than BeautifulSoup with far less memory; the read-only passes
+# use it when available, falling back to BeautifulSoup. Mutation passes
+# stay on BeautifulSoup, whose tree-rewriting API selectolax lacks.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    LexborHTMLParser = None
+    HAS_SELECTOLAX = False
+
+# Map common PDF fonts to web-safe fonts
+_FONT_MAP = {
+    'times': 'Times New Roman, serif',
+    'arial': 'Arial, sans-serif',
+    'helvetica': 'Helvetica, Arial, sans-serif',
+    'courier': 'Courier New, monospace',
+    'calibri': 'Calibri, sans-serif',
+    'verdana': 'Verdana, sans-serif',
+    'georgia': 'Georgia, serif'
+}
+
+
+@lru_cache(maxsize=256)
+def _font_attributes(font_name):
+    """Resolve a PDF font name to (css family, bold, italic), cached.
+
+    A document uses a handful of distinct font names across tens of
+    thousands of characters, so each name is analyzed once and every
+    later character with the same name is a cache hit instead of
+    repeating the lowercase scans and the subset-prefix regex.
+    """
+    if not font_name:
+        return ('Arial', False, False)
+
+    # Remove subset prefix (e.g., "ABCDEF+")
+    base_name = re.sub(r'^[A-Z]{6}\+', '', font_name)
+    font_lower = base_name.lower()
+
+    family = 'Arial, sans-serif'
+    for key, value in _FONT_MAP.items():
+        if key in font_lower:
+            family = value
+            break
+
+    is_bold = 'bold' in font_lower
+    is_italic = 'italic' in font_lower or 'oblique' in font_lower
+    return (family, is_bold, is_italic)
+
+
+@lru_cache(maxsize=1024)
+def _span_css(font, size, bold, italic, color, default_font_size):
+    """Build the inline CSS for one span style, cached.
+
+    A page reuses the same handful of styles across thousands of spans,
+    so each distinct style's CSS string is assembled only once.
+    """
+    css_parts = []
+
+    if font:
+        css_parts.append(f"font-family: {font}")
+
+    if size and abs(size - default_font_size) > 0.5:
+        css_parts.append(f"font-size: {size}pt")
+
+    if bold:
+        css_parts.append("font-weight: bold")
+
+    if italic:
+        css_parts.append("font-style: italic")
+
+    if color:
+        # Convert RGB color to hex
+        try:
+            if len(color) >= 3:
+                r, g, b = [int(c * 255) for c in color[:3]]
+                # Only apply if not black (default text color)
+                if not (r < 50 and g < 50 and b < 50):
+                    css_parts.append(f"color: rgb({r}, {g}, {b})")
+        except:
+            pass
+
+    return '; '.join(css_parts)
+
+
+@lru_cache(maxsize=1024)
+def _span_open(style_attr):
+    """Cached span open tag for a CSS string."""
+    return f'<span style="{style_attr}">'
+
+
+# Documents shorter than this convert serially; for a handful of pages
+# the process-pool start-up costs more than it saves
+_PARALLEL_PAGE_THRESHOLD = 4
+
+
+def _convert_page_worker(args):
+    """Convert one page to HTML; runs in a worker process.
+
+    Each page's chars-to-positioned-HTML work is independent CPU-bound
+    Python, so pages shard cleanly across processes. The worker re-opens
+    the PDF restricted to its single page.
+    """
+    pdf_path, page_num, default_font_size = args
+    processor = PDFProcessor()
+    processor.default_font_size = default_font_size
+    with pdfplumber.open(pdf_path, pages=[page_num]) as pdf:
+        return processor._convert_page(pdf.pages[0], page_num)
+
+
+# Pages whose raw content stream exceeds this while containing almost
+# no text are drawings or scanned images; layout analysis on them is
+# pure overhead
+_GRAPHICS_STREAM_THRESHOLD = 1 << 20  # 1 MiB
+
+
+def _content_stream_size(page):
+    """Best-effort size in bytes of a page's raw content stream(s).
+
+    Reads the compressed stream length straight from the pdfminer page
+    object without decoding or interpreting the stream.
+    """
+    try:
+        from pdfminer.pdftypes import resolve1
+        contents = page.page_obj.contents or []
+        if not isinstance(contents, list):
+            contents = [contents]
+        total = 0
+        for stream in contents:
+            raw = getattr(resolve1(stream), 'rawdata', None)
+            if raw:
+                total += len(raw)
+        return total
+    except Exception:
+        return 0
+
+
+# Common concatenated phrases and their corrected forms, applied by
+# fix_word_spacing in one alternation pass instead of one str.replace
+# scan per phrase
+_WORD_FIXES = {
+    'Startdate': 'Start date',
+    'Lastdaytoenroll': 'Last day to enroll',
+    'Enrollmentfeerefunddeadline': 'Enrollment fee refund deadline',
+    'Coursesclose': 'Courses close',
+    'Importantdates': 'Important dates',
+    # Case variations
+    'startdate': 'start date',
+    'lastdaytoenroll': 'last day to enroll',
+    'enrollmentfeerefunddeadline': 'enrollment fee refund deadline',
+    'coursesclose': 'courses close',
+    'importantdates': 'important dates',
+}
+_WORD_FIXES_RE = re.compile('|'.join(re.escape(k) for k in _WORD_FIXES))
+
+# All fourteen HTML void elements in one alternation, so stripping the
+# self-closing slashes after serialization is a single pass over the
+# document instead of fourteen
+_VOID_ELEMENT_RE = re.compile(
+    r'<(area|base|br|col|embed|hr|img|input|link|meta|param|source|track|wbr)'
+    r'([^>]*?)\s*/>',
+    re.IGNORECASE)
+
+# One C-level translate pass escapes all five HTML metacharacters at
+# once instead of five full replace scans per string
+_HTML_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+})
+
+# Compiled once; fix_word_spacing runs per table cell, and re.sub with a
+# string pattern pays a cache lookup on every call
+_LOWER_UPPER_RE = re.compile(r'([a-z])([A-Z])')
+_LETTER_DIGIT_RE = re.compile(r'([a-zA-Z])(\d)')
+_DIGIT_COMMA_RE = re.compile(r'(\d),(\d)')
+
+
+# The document shell around the converted pages, split so the final
+# document is assembled in one join without first building a separate
+# body string
+_HTML_HEAD = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Remediated Document</title>
+    <style>
+        /* Reset and base styles */
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        body {
+            background-color: #f0f0f0;
+            padding: 20px;
+            font-family: Arial, sans-serif;
+        }
+
+        /* PDF Page container - exact replica */
+        .pdf-page {
+            background-color: #ffffff;
+            margin: 20px auto;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            position: relative;
+            overflow: hidden;
+        }
+
+        /* Preserve exact positioning */
+        .pdf-page > div {
+            line-height: 1.0;
+        }
+
+        /* Table styles - accessibility compliant */
+        table {
+            border-collapse: collapse;
+            background-color: #ffffff;
+        }
+        th, td {
+            border: 1px solid #cccccc;
+            padding: 8px 12px;
+            text-align: left;
+            vertical-align: top;
+        }
+        th {
+            background-color: #2c3e50;
+            color: #ffffff;
+            font-weight: 700;
+        }
+        tr:nth-child(even) {
+            background-color: #f8f9fa;
+        }
+
+        /* Link accessibility */
+        a {
+            color: #0066cc;
+            text-decoration: underline;
+        }
+        a:hover {
+            color: #0052a3;
+        }
+        a:focus {
+            outline: 3px solid #0066cc;
+            outline-offset: 2px;
+            background-color: #ffffcc;
+        }
+
+        /* Skip navigation for accessibility */
+        .skip-link {
+            position: absolute;
+            top: -40px;
+            left: 0;
+            background: #000000;
+            color: #ffffff;
+            padding: 8px;
+            text-decoration: none;
+            z-index: 100;
+            font-weight: bold;
+        }
+        .skip-link:focus {
+            top: 0;
+        }
+
+        /* Image accessibility */
+        img {
+            max-width: 100%;
+            height: auto;
+        }
+
+        /* Ensure spans display inline */
+        span {
+            display: inline;
+        }
+
+        /* Print styles */
+        @media print {
+            body {
+                background-color: #ffffff;
+                padding: 0;
+            }
+            .pdf-page {
+                box-shadow: none;
+                margin: 0;
+                page-break-after: always;
+            }
+        }
+    </style>
+</head>
+<body>
+    <a href="#main-content" class="skip-link">Skip to main content</a>
+    <main id="main-content">
+        '''
+
+_HTML_TAIL = '''
+    </main>
+</body>
+</html>'''
+
 
 class PDFProcessor:
+    # One Playwright driver and Chromium instance shared by every
+    # conversion: launching the browser costs on the order of a second,
+    # while a fresh context per document is milliseconds. The sync
+    # Playwright API is greenlet-based and bound to the thread that
+    # started it, so the driver, the browser and every render are
+    # confined to the single thread of this dedicated executor; callers
+    # block on the submitted future
+    _playwright = None
+    _browser = None
+    _render_pool = ThreadPoolExecutor(max_workers=1,
+                                      thread_name_prefix='pdf-render')
+
     def __init__(self):
         self.default_font_size = 12
         self.heading_threshold = 14  # Font sizes >= this are considered headings
         self.ocr_warning = None  # Store OCR detection results
 
+    @classmethod
+    def _ensure_browser(cls):
+        """Start Playwright and launch Chromium once, reusing it after.
+
+        Only ever runs on the render thread.
+        """
+        if cls._browser is None or not cls._browser.is_connected():
+            if cls._playwright is None:
+                cls._playwright = sync_playwright().start()
+            cls._browser = cls._playwright.chromium.launch()
+        return cls._browser
+
+    @classmethod
+    def close_browser(cls):
+        """Shut down the shared browser and the Playwright driver."""
+        cls._render_pool.submit(cls._close_browser_on_render_thread).result()
+
+    @classmethod
+    def _close_browser_on_render_thread(cls):
+        if cls._browser is not None:
+            try:
+                cls._browser.close()
+            except Exception:
+                pass
+            cls._browser = None
+        if cls._playwright is not None:
+            try:
+                cls._playwright.stop()
+            except Exception:
+                pass
+            cls._playwright = None
+
     def detect_ocr_needed(self, pdf_path):
         """
         Detect if PDF is graphically-rendered and needs OCR.
@@ -40,75 +388,111 @@ class PDFProcessor:
         """
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                pages_without_text = 0
-                total_text_length = 0
-                has_large_images = False
-
-                for page_num, page in enumerate(pdf.pages, 1):
-                    # Check for text content
-                    text = page.extract_text()
-                    if not text or len(text.strip()) < 10:
-                        pages_without_text += 1
-                    else:
-                        total_text_length += len(text.strip())
-
-                    # Check for large images
-                    if hasattr(page, 'images'):
-                        for img in page.images:
-                            width = img.get('width', 0)
-                            height = img.get('height', 0)
-                            if width > 1500 or height > 1500:
-                                has_large_images = True
-                                print(f"  Page {page_num}: Found large image ({width}x{height})")
-
-                # Determine if OCR is needed
-                reasons = []
-
-                # More than 50% of pages have no text
-                if pages_without_text > total_pages * 0.5:
-                    reasons.append(f"{pages_without_text}/{total_pages} pages have no extractable text")
-
-                # Very little total text (less than 100 chars per page average)
-                avg_text_per_page = total_text_length / total_pages if total_pages > 0 else 0
-                if avg_text_per_page < 100:
-                    reasons.append("Minimal text content detected")
-
-                # Has large background images
-                if has_large_images:
-                    reasons.append("Large background images found")
-
-                if reasons:
-                    reason = "This PDF may require OCR processing: " + ", ".join(reasons)
-                    return True, reason
-
-                return False, ""
+                return self._detect_ocr_needed_from_pdf(pdf)
 
         except Exception as e:
             print(f"Warning: Error during OCR detection: {e}")
             return False, ""
 
+    def _detect_ocr_needed_from_pdf(self, pdf):
+        """OCR detection against an already-open pdfplumber PDF."""
+        total_pages = len(pdf.pages)
+        pages_without_text = 0
+        total_text_length = 0
+        has_large_images = False
+
+        threshold = total_pages * 0.5
+
+        for page_num, page in enumerate(pdf.pages, 1):
+            # Probe text straight from the page's char objects instead
+            # of running extract_text, whose word-assembly layout pass
+            # costs far more than "is there any text" needs. The parsed
+            # chars stay cached on the page, so the HTML conversion that
+            # follows in process_pdf reuses them for free
+            chars = page.objects.get('char', [])
+            text_length = sum(len(c.get('text', '').strip()) for c in chars)
+            if text_length < 10:
+                pages_without_text += 1
+            else:
+                total_text_length += text_length
+
+            # Check for large images
+            if hasattr(page, 'images'):
+                for img in page.images:
+                    width = img.get('width', 0)
+                    height = img.get('height', 0)
+                    if width > 1500 or height > 1500:
+                        has_large_images = True
+                        print(f"  Page {page_num}: Found large image ({width}x{height})")
+
+            # Stop scanning once the remaining pages can no longer
+            # change the verdict
+            remaining = total_pages - page_num
+            if pages_without_text > threshold:
+                # The no-text criterion is already met; the answer is
+                # fixed no matter what the rest of the document holds
+                break
+            if (not has_large_images
+                    and pages_without_text + remaining <= threshold
+                    and total_text_length >= 100 * total_pages):
+                # Every criterion is out of reach: the average-text bar
+                # is cleared, the no-text count can't cross half, and on
+                # a document this text-rich a late background image
+                # wouldn't call for OCR anyway
+                break
+
+        # Determine if OCR is needed
+        reasons = []
+
+        # More than 50% of pages have no text
+        if pages_without_text > total_pages * 0.5:
+            reasons.append(f"{pages_without_text}/{total_pages} pages have no extractable text")
+
+        # Very little total text (less than 100 chars per page average)
+        avg_text_per_page = total_text_length / total_pages if total_pages > 0 else 0
+        if avg_text_per_page < 100:
+            reasons.append("Minimal text content detected")
+
+        # Has large background images
+        if has_large_images:
+            reasons.append("Large background images found")
+
+        if reasons:
+            reason = "This PDF may require OCR processing: " + ", ".join(reasons)
+            return True, reason
+
+        return False, ""
+
     def process_pdf(self, input_pdf_path, output_folder, document_title=None):
         """Main processing pipeline"""
-        # Step 0: Check if PDF needs OCR
-        needs_ocr, ocr_reason = self.detect_ocr_needed(input_pdf_path)
-        if needs_ocr:
-            self.ocr_warning = ocr_reason
-            print(f"\n⚠️  WARNING: {ocr_reason}")
-            print("    Consider using OCR tools before remediation for best results.\n")
+        # One pdfplumber open serves both the OCR check and the HTML
+        # conversion: the xref/catalog parse happens once, and the page
+        # objects (with their cached char data) are shared
+        with pdfplumber.open(input_pdf_path) as pdf:
+            # Step 0: Check if PDF needs OCR
+            try:
+                needs_ocr, ocr_reason = self._detect_ocr_needed_from_pdf(pdf)
+            except Exception as e:
+                print(f"Warning: Error during OCR detection: {e}")
+                needs_ocr, ocr_reason = False, ""
+            if needs_ocr:
+                self.ocr_warning = ocr_reason
+                print(f"\n⚠️  WARNING: {ocr_reason}")
+                print("    Consider using OCR tools before remediation for best results.\n")
 
-        # Extract original filename (without extension)
-        original_filename = os.path.splitext(os.path.basename(input_pdf_path))[0]
+            # Extract original filename (without extension)
+            original_filename = os.path.splitext(os.path.basename(input_pdf_path))[0]
 
-        # Use provided document title or fallback to filename
-        if not document_title:
-            document_title = original_filename.replace('_', ' ')
+            # Use provided document title or fallback to filename
+            if not document_title:
+                document_title = original_filename.replace('_', ' ')
 
-        # Store document title for use in HTML generation
-        self.document_title = document_title
+            # Store document title for use in HTML generation
+            self.document_title = document_title
 
-        # Step 1: Convert PDF to HTML with style preservation
-        html_content, extracted_styles = self.pdf_to_html_with_styles(input_pdf_path)
+            # Step 1: Convert PDF to HTML with style preservation
+            html_content, extracted_styles = self._pdf_to_html_from_pdf(
+                pdf, pdf_path=input_pdf_path)
 
         # Step 2: Remediate HTML for WCAG 2.2 AA compliance
         remediated_html = self.remediate_html(html_content)
@@ -126,91 +510,137 @@ class PDFProcessor:
 
         return {
             'html_file': html_filename,
-            'pdf_file': pdf_filename
+            'pdf_file': pdf_filename,
+            # Already in memory; callers that need the document (e.g. the
+            # accessibility check) can skip re-reading the file just written
+            'html_content': remediated_html
         }
 
     def pdf_to_html_with_styles(self, pdf_path):
         """Convert PDF to HTML with exact visual replica of design"""
+        with pdfplumber.open(pdf_path) as pdf:
+            return self._pdf_to_html_from_pdf(pdf, pdf_path=pdf_path)
+
+    def _pdf_to_html_from_pdf(self, pdf, pdf_path=None):
+        """HTML conversion against an already-open pdfplumber PDF.
+
+        When the source path is known and the document is long enough,
+        pages convert in parallel across a process pool; otherwise they
+        convert serially in this process.
+        """
         pages_html = []
         extracted_styles = {
             'fonts': set(),
-            'colors': set(),
-            'sizes': []
+            'colors': set()
         }
 
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                # Get page dimensions
-                page_width = page.width
-                page_height = page.height
-
-                # Extract text with detailed character information
-                chars = page.chars
-
-                if chars:
-                    # Analyze font sizes for statistics
-                    font_sizes = [char.get('size', self.default_font_size) for char in chars]
-                    extracted_styles['sizes'].extend(font_sizes)
-
-                    # Create page with exact positioning
-                    page_html = self.create_page_with_exact_layout(chars, page_width, page_height, page_num)
-                    pages_html.append(page_html)
-
-                # Extract tables with positioning and improved text extraction
-                # Configure table settings with better word spacing detection
-                table_settings = {
-                    "vertical_strategy": "lines",
-                    "horizontal_strategy": "lines",
-                    "text_x_tolerance": 3,  # Increased tolerance for better word detection
-                    "text_y_tolerance": 3,
-                    "intersection_tolerance": 3
-                }
-                tables = page.extract_tables(table_settings=table_settings)
-                if tables:
-                    for table_idx, table in enumerate(tables):
-                        if table:
-                            # Try to get table position
-                            try:
-                                table_bbox = page.find_tables()[table_idx].bbox
-                                table_html = self.table_to_html_with_position(table, table_bbox)
-                                pages_html.append(table_html)
-                            except:
-                                pages_html.append(self.table_to_html_with_style(table))
+        page_count = len(pdf.pages)
+        if (pdf_path and page_count >= _PARALLEL_PAGE_THRESHOLD
+                and (os.cpu_count() or 1) > 1):
+            jobs = [(pdf_path, page_num, self.default_font_size)
+                    for page_num in range(1, page_count + 1)]
+            with ProcessPoolExecutor() as executor:
+                # map keeps results in page order
+                page_results = list(executor.map(_convert_page_worker, jobs))
+        else:
+            page_results = [self._convert_page(page, page_num)
+                            for page_num, page in enumerate(pdf.pages, 1)]
+
+        # Running sum and count give the document-wide average without
+        # ever holding one float per character in memory
+        size_sum = 0.0
+        size_count = 0
+        for html_parts, page_size_sum, page_size_count in page_results:
+            pages_html.extend(html_parts)
+            size_sum += page_size_sum
+            size_count += page_size_count
 
         # Determine font size statistics
-        if extracted_styles['sizes']:
-            avg_size = sum(extracted_styles['sizes']) / len(extracted_styles['sizes'])
-            self.default_font_size = avg_size
+        if size_count:
+            self.default_font_size = size_sum / size_count
 
         # Create HTML structure with exact layout preservation
-        html_content = self.create_exact_replica_html('\n'.join(pages_html), extracted_styles)
+        html_content = self.create_exact_replica_html(pages_html, extracted_styles)
         return html_content, extracted_styles
 
+    def _convert_page(self, page, page_num):
+        """Convert one page to its HTML fragments.
+
+        Returns (html_parts, size_sum, size_count): the page div plus
+        any table markup, and the page's font-size totals for the
+        document-wide average.
+        """
+        html_parts = []
+        size_sum = 0.0
+        size_count = 0
+
+        # Get page dimensions
+        page_width = page.width
+        page_height = page.height
+
+        # Extract text with detailed character information
+        chars = page.chars
+
+        # Graphics-heavy fast path: a multi-megabyte content stream
+        # with almost no text is a drawing or a scanned image, and
+        # running layout and table analysis on it buys nothing
+        if (len(chars) < 5 and
+                _content_stream_size(page) > _GRAPHICS_STREAM_THRESHOLD):
+            html_parts.append(
+                f'<div class="pdf-page" data-page="{page_num}" data-page-skipped="true" '
+                f'style="width: {page_width}pt; height: {page_height}pt;"></div>')
+            return html_parts, size_sum, size_count
+
+        if chars:
+            # Analyze font sizes for statistics
+            size_sum = sum(char.get('size', self.default_font_size) for char in chars)
+            size_count = len(chars)
+
+            # Create page with exact positioning
+            page_html = self.create_page_with_exact_layout(chars, page_width, page_height, page_num)
+            html_parts.append(page_html)
+
+        # Extract tables with positioning and improved text extraction
+        # Configure table settings with better word spacing detection
+        table_settings = {
+            "vertical_strategy": "lines",
+            "horizontal_strategy": "lines",
+            "text_x_tolerance": 3,  # Increased tolerance for better word detection
+            "text_y_tolerance": 3,
+            "intersection_tolerance": 3
+        }
+        # Detect tables once; each Table object carries both its
+        # bbox and its cells, so no second find_tables() pass (which
+        # re-runs the whole detection algorithm) is needed per table
+        found_tables = page.find_tables(table_settings=table_settings)
+        for table_obj in found_tables:
+            table = table_obj.extract()
+            if table:
+                try:
+                    table_html = self.table_to_html_with_position(table, table_obj.bbox)
+                    html_parts.append(table_html)
+                except:
+                    html_parts.append(self.table_to_html_with_style(table))
+
+        return html_parts, size_sum, size_count
+
     def create_page_with_exact_layout(self, chars, page_width, page_height, page_num):
         """Create a page with exact positioning matching PDF layout"""
         if not chars:
             return f'<div class="pdf-page" data-page="{page_num}" style="width: {page_width}pt; height: {page_height}pt;"></div>'
 
-        # Group characters by line (y-coordinate)
-        lines = {}
-        for char in chars:
-            y = round(char['top'], 1)
-            if y not in lines:
-                lines[y] = []
-            lines[y].append(char)
-
-        # Sort lines by vertical position
-        sorted_lines = sorted(lines.items(), key=lambda x: x[0])
+        # One composite sort by (line, x) orders every character at
+        # once; groupby then walks the lines directly, replacing the
+        # dict-of-lines build and its many small per-line sorts
+        chars_sorted = sorted(chars, key=lambda c: (round(c['top'], 1), c['x0']))
 
-        # Build HTML for each line with exact positioning
-        page_html = f'<div class="pdf-page" data-page="{page_num}" style="width: {page_width}pt; height: {page_height}pt; position: relative;">\n'
+        # Build HTML for each line with exact positioning; collected in
+        # a list and joined once, since += on a growing string recopies
+        # it on every line
+        parts = [f'<div class="pdf-page" data-page="{page_num}" style="width: {page_width}pt; height: {page_height}pt; position: relative;">\n']
 
-        for y, line_chars in sorted_lines:
-            # Sort characters by horizontal position
-            line_chars.sort(key=lambda c: c['x0'])
-
-            if not line_chars:
-                continue
+        for y, line_iter in groupby(chars_sorted, key=lambda c: round(c['top'], 1)):
+            line_chars = list(line_iter)
 
             # Get line position
             x_start = line_chars[0]['x0']
@@ -220,10 +650,10 @@ class PDFProcessor:
 
             if styled_html.strip():
                 # Create absolutely positioned line
-                page_html += f'    <div style="position: absolute; left: {x_start}pt; top: {y}pt; white-space: nowrap;">{styled_html}</div>\n'
+                parts.append(f'    <div style="position: absolute; left: {x_start}pt; top: {y}pt; white-space: nowrap;">{styled_html}</div>\n')
 
-        page_html += '</div>\n'
-        return page_html
+        parts.append('</div>\n')
+        return ''.join(parts)
 
     def table_to_html_with_position(self, table, bbox):
         """Convert table to HTML with exact positioning"""
@@ -242,27 +672,28 @@ class PDFProcessor:
             return []
 
         blocks = []
-        lines = {}
-
-        # Group characters by vertical position (y-coordinate)
-        for char in chars:
-            y = round(char['top'])
-            if y not in lines:
-                lines[y] = []
-            lines[y].append(char)
 
-        # Sort lines by vertical position
-        sorted_lines = sorted(lines.items(), key=lambda x: x[0])
+        # Same composite-sort-plus-groupby line walk as
+        # create_page_with_exact_layout (whole-unit y rounding here)
+        chars_sorted = sorted(chars, key=lambda c: (round(c['top']), c['x0']))
 
         current_paragraph = []
         current_paragraph_chars = []
 
-        for y, line_chars in sorted_lines:
-            # Sort characters in line by horizontal position
-            line_chars.sort(key=lambda c: c['x0'])
-
-            # Extract text and style info
-            line_text = ''.join(c.get('text', '') for c in line_chars)
+        for y, line_iter in groupby(chars_sorted, key=lambda c: round(c['top'])):
+            line_chars = list(line_iter)
+
+            # One pass per line gathers the text, size total and bold
+            # flag together instead of three separate generator walks
+            text_parts = []
+            size_total = 0.0
+            is_bold = False
+            for c in line_chars:
+                text_parts.append(c.get('text', ''))
+                size_total += c.get('size', self.default_font_size)
+                if not is_bold and _font_attributes(c.get('fontname', ''))[1]:
+                    is_bold = True
+            line_text = ''.join(text_parts)
 
             if not line_text.strip():
                 # Empty line - end current paragraph
@@ -272,9 +703,7 @@ class PDFProcessor:
                     current_paragraph_chars = []
                 continue
 
-            # Analyze line style
-            avg_size = sum(c.get('size', self.default_font_size) for c in line_chars) / len(line_chars)
-            is_bold = any(c.get('fontname', '').lower().find('bold') != -1 for c in line_chars)
+            avg_size = size_total / len(line_chars)
 
             # Determine if this is a heading based on size and characteristics
             if self.is_heading_line(line_text, avg_size, is_bold):
@@ -373,45 +802,35 @@ class PDFProcessor:
 
         result = []
         current_group = []
+        current_key = None
         current_style = None
-        prev_char = None
+        prev_x1 = None
+
+        # Locals resolve faster than attribute lookups in this loop,
+        # which runs once per character of the document
+        default_size = self.default_font_size
+        make_span = self.create_styled_span
 
         for char in chars:
             char_text = char.get('text', '')
             if not char_text:
                 continue
 
-            # Extract style information
             font_name = char.get('fontname', '')
-            font_size = char.get('size', self.default_font_size)
-
-            # Determine if bold or italic
-            is_bold = 'bold' in font_name.lower()
-            is_italic = 'italic' in font_name.lower() or 'oblique' in font_name.lower()
+            font_size = char.get('size', default_size)
 
             # Get color (if available)
-            color = None
-            if 'stroking_color' in char and char['stroking_color']:
-                color = char['stroking_color']
-            elif 'non_stroking_color' in char and char['non_stroking_color']:
-                color = char['non_stroking_color']
-
-            # Create style dict
-            style = {
-                'bold': is_bold,
-                'italic': is_italic,
-                'size': round(font_size, 1),
-                'font': self.extract_font_family(font_name),
-                'color': color
-            }
+            color = char.get('stroking_color') or char.get('non_stroking_color')
+
+            # Cheap per-char run key: the heavier style analysis (bold /
+            # italic probes, font-family mapping) runs once per style
+            # run below, not once per character
+            key = (font_name, round(font_size, 1), color)
 
             # Check if we need to insert a space (detect gap between characters)
             should_add_space = False
-            if prev_char and current_group:
-                # Calculate gap between previous and current character
-                prev_x1 = prev_char.get('x1', 0)
-                curr_x0 = char.get('x0', 0)
-                gap = curr_x0 - prev_x1
+            if prev_x1 is not None and current_group:
+                gap = char.get('x0', 0) - prev_x1
 
                 # If gap is larger than 20% of character width, insert space
                 char_width = char.get('width', font_size * 0.5)
@@ -419,21 +838,31 @@ class PDFProcessor:
                     should_add_space = True
 
             # Check if style changed
-            if current_style is None or current_style != style:
+            if key != current_key:
                 # Save previous group
                 if current_group and current_style:
-                    result.append(self.create_styled_span(current_group, current_style))
+                    result.append(make_span(current_group, current_style))
+
+                # Analyze the new run's style once
+                family, is_bold, is_italic = _font_attributes(font_name)
+                current_style = {
+                    'bold': is_bold,
+                    'italic': is_italic,
+                    'size': key[1],
+                    'font': family,
+                    'color': color if color else None
+                }
+                current_key = key
 
                 # Start new group
                 current_group = [char_text]
-                current_style = style
             else:
                 # Add space if needed, then add character
                 if should_add_space:
                     current_group.append(' ')
                 current_group.append(char_text)
 
-            prev_char = char
+            prev_x1 = char.get('x1', 0)
 
         # Add final group
         if current_group and current_style:
@@ -443,65 +872,26 @@ class PDFProcessor:
 
     def extract_font_family(self, font_name):
         """Extract readable font family name from PDF font name"""
-        if not font_name:
-            return 'Arial'
-
-        # Remove prefix (e.g., "ABCDEF+")
-        font_name = re.sub(r'^[A-Z]{6}\+', '', font_name)
-
-        # Map common PDF fonts to web-safe fonts
-        font_map = {
-            'times': 'Times New Roman, serif',
-            'arial': 'Arial, sans-serif',
-            'helvetica': 'Helvetica, Arial, sans-serif',
-            'courier': 'Courier New, monospace',
-            'calibri': 'Calibri, sans-serif',
-            'verdana': 'Verdana, sans-serif',
-            'georgia': 'Georgia, serif'
-        }
-
-        font_lower = font_name.lower()
-        for key, value in font_map.items():
-            if key in font_lower:
-                return value
-
-        # Default to sans-serif
-        return 'Arial, sans-serif'
+        return _font_attributes(font_name)[0]
 
     def create_styled_span(self, chars, style):
         """Create a styled span element"""
         text = ''.join(chars)
         text_escaped = self.escape_html(text)
 
-        # Build inline CSS
-        css_parts = []
-
-        if style.get('font'):
-            css_parts.append(f"font-family: {style['font']}")
-
-        if style.get('size') and abs(style['size'] - self.default_font_size) > 0.5:
-            css_parts.append(f"font-size: {style['size']}pt")
-
-        if style.get('bold'):
-            css_parts.append("font-weight: bold")
-
-        if style.get('italic'):
-            css_parts.append("font-style: italic")
-
-        if style.get('color') and isinstance(style['color'], (list, tuple)):
-            # Convert RGB color to hex
-            try:
-                if len(style['color']) >= 3:
-                    r, g, b = [int(c * 255) for c in style['color'][:3]]
-                    # Only apply if not black (default text color)
-                    if not (r < 50 and g < 50 and b < 50):
-                        css_parts.append(f"color: rgb({r}, {g}, {b})")
-            except:
-                pass
+        # Colors arrive as lists from pdfplumber; tuples are hashable
+        # for the CSS cache
+        color = style.get('color')
+        if isinstance(color, list):
+            color = tuple(color)
+        elif not isinstance(color, tuple):
+            color = None
 
-        if css_parts:
-            style_attr = '; '.join(css_parts)
-            return f'<span style="{style_attr}">{text_escaped}</span>'
+        style_attr = _span_css(style.get('font'), style.get('size'),
+                               bool(style.get('bold')), bool(style.get('italic')),
+                               color, self.default_font_size)
+        if style_attr:
+            return _span_open(style_attr) + text_escaped + '</span>'
         else:
             return text_escaped
 
@@ -522,47 +912,27 @@ class PDFProcessor:
 
     def escape_html(self, text):
         """Escape HTML special characters"""
-        return (text.replace('&', '&amp;')
-                   .replace('<', '&lt;')
-                   .replace('>', '&gt;')
-                   .replace('"', '&quot;')
-                   .replace("'", '&#39;'))
+        return text.translate(_HTML_ESCAPES)
 
     def fix_word_spacing(self, text):
         """Fix missing spaces in text by detecting word boundaries"""
         if not text:
             return text
 
-        # Dictionary of common concatenated phrases and their corrected forms
-        replacements = {
-            'Startdate': 'Start date',
-            'Lastdaytoenroll': 'Last day to enroll',
-            'Enrollmentfeerefunddeadline': 'Enrollment fee refund deadline',
-            'Coursesclose': 'Courses close',
-            'Importantdates': 'Important dates',
-            # Case variations
-            'startdate': 'start date',
-            'lastdaytoenroll': 'last day to enroll',
-            'enrollmentfeerefunddeadline': 'enrollment fee refund deadline',
-            'coursesclose': 'courses close',
-            'importantdates': 'important dates',
-        }
-
-        # Apply dictionary replacements
-        for old, new in replacements.items():
-            text = text.replace(old, new)
+        # Apply the phrase dictionary in a single scan
+        text = _WORD_FIXES_RE.sub(lambda m: _WORD_FIXES[m.group(0)], text)
 
         # Add space before uppercase letters that follow lowercase letters
         # e.g., "FallA" -> "Fall A"
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
+        text = _LOWER_UPPER_RE.sub(r'\1 \2', text)
 
         # Add space before numbers that follow letters
         # e.g., "August19" -> "August 19"
-        text = re.sub(r'([a-zA-Z])(\d)', r'\1 \2', text)
+        text = _LETTER_DIGIT_RE.sub(r'\1 \2', text)
 
         # Add space after commas between numbers (for dates)
         # e.g., "19,2025" -> "19, 2025"
-        text = re.sub(r'(\d),(\d)', r'\1, \2', text)
+        text = _DIGIT_COMMA_RE.sub(r'\1, \2', text)
 
         return text
 
@@ -597,122 +967,21 @@ class PDFProcessor:
         return '\n'.join(html_parts)
 
     def create_exact_replica_html(self, body_content, extracted_styles):
-        """Create complete HTML document with exact PDF layout"""
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Remediated Document</title>
-    <style>
-        /* Reset and base styles */
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            background-color: #f0f0f0;
-            padding: 20px;
-            font-family: Arial, sans-serif;
-        }}
-
-        /* PDF Page container - exact replica */
-        .pdf-page {{
-            background-color: #ffffff;
-            margin: 20px auto;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            position: relative;
-            overflow: hidden;
-        }}
+        """Create complete HTML document with exact PDF layout.
 
-        /* Preserve exact positioning */
-        .pdf-page > div {{
-            line-height: 1.0;
-        }}
-
-        /* Table styles - accessibility compliant */
-        table {{
-            border-collapse: collapse;
-            background-color: #ffffff;
-        }}
-        th, td {{
-            border: 1px solid #cccccc;
-            padding: 8px 12px;
-            text-align: left;
-            vertical-align: top;
-        }}
-        th {{
-            background-color: #2c3e50;
-            color: #ffffff;
-            font-weight: 700;
-        }}
-        tr:nth-child(even) {{
-            background-color: #f8f9fa;
-        }}
-
-        /* Link accessibility */
-        a {{
-            color: #0066cc;
-            text-decoration: underline;
-        }}
-        a:hover {{
-            color: #0052a3;
-        }}
-        a:focus {{
-            outline: 3px solid #0066cc;
-            outline-offset: 2px;
-            background-color: #ffffcc;
-        }}
-
-        /* Skip navigation for accessibility */
-        .skip-link {{
-            position: absolute;
-            top: -40px;
-            left: 0;
-            background: #000000;
-            color: #ffffff;
-            padding: 8px;
-            text-decoration: none;
-            z-index: 100;
-            font-weight: bold;
-        }}
-        .skip-link:focus {{
-            top: 0;
-        }}
-
-        /* Image accessibility */
-        img {{
-            max-width: 100%;
-            height: auto;
-        }}
-
-        /* Ensure spans display inline */
-        span {{
-            display: inline;
-        }}
-
-        /* Print styles */
-        @media print {{
-            body {{
-                background-color: #ffffff;
-                padding: 0;
-            }}
-            .pdf-page {{
-                box-shadow: none;
-                margin: 0;
-                page-break-after: always;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <a href="#main-content" class="skip-link">Skip to main content</a>
-    <main id="main-content">
-        {body_content}
-    </main>
-</body>
-</html>'''
+        body_content may be one string or a list of page fragments; the
+        fragments go straight into the final join, so the assembled body
+        never exists as a separate intermediate copy.
+        """
+        if isinstance(body_content, str):
+            body_content = [body_content]
+        parts = [_HTML_HEAD]
+        for i, fragment in enumerate(body_content):
+            if i:
+                parts.append('\n')
+            parts.append(fragment)
+        parts.append(_HTML_TAIL)
+        return ''.join(parts)
 
     def create_html_structure_with_styles(self, body_content, extracted_styles):
         """Create complete HTML document with preserved styles (legacy method)"""
@@ -720,7 +989,10 @@ class PDFProcessor:
 
     def remediate_html(self, html_content):
         """Apply WCAG 2.2 AA accessibility remediations while preserving exact layout"""
-        soup = BeautifulSoup(html_content, 'html5lib')
+        # lxml parses several times faster than html5lib with less
+        # memory; the input here is our own well-formed generated HTML,
+        # so html5lib's error recovery buys nothing
+        soup = BeautifulSoup(html_content, 'lxml')
 
         # Add language attribute if missing
         html_tag = soup.find('html')
@@ -740,17 +1012,25 @@ class PDFProcessor:
             doc_title = getattr(self, 'document_title', 'Remediated Document')
             title_tag.string = doc_title
 
-        # Add alt text to images (preserving layout)
-        self.add_alt_text_to_images(soup)
+        # Cheap substring probes on the raw document stand in for a
+        # SoupStrainer: the full tree is still needed for serialization,
+        # so instead of restricting the parse we skip whole remediation
+        # passes whose target tags never occur
+        if '<img' in html_content:
+            # Add alt text to images (preserving layout)
+            self.add_alt_text_to_images(soup)
 
-        # Ensure tables have proper headers and captions (preserving position)
-        self.remediate_tables(soup)
+        if '<table' in html_content:
+            # Ensure tables have proper headers and captions (preserving position)
+            self.remediate_tables(soup)
 
-        # Fix links (preserving layout)
-        self.remediate_links(soup)
+        if '<a ' in html_content or '<a>' in html_content:
+            # Fix links (preserving layout)
+            self.remediate_links(soup)
 
-        # Ensure form elements have labels (if any, preserving position)
-        self.remediate_forms(soup)
+        if '<input' in html_content or '<form' in html_content:
+            # Ensure form elements have labels (if any, preserving position)
+            self.remediate_forms(soup)
 
         # Ensure main landmark has id (skip navigation already in template)
         main = soup.find('main')
@@ -760,14 +1040,10 @@ class PDFProcessor:
         # Use html formatter to avoid self-closing tags
         html_output = soup.decode(formatter='html')
 
-        # Remove self-closing slashes from void elements (HTML5 compliance)
-        void_elements = ['area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
-                        'link', 'meta', 'param', 'source', 'track', 'wbr']
-        for element in void_elements:
-            # Replace <element .../> with <element ...>
-            html_output = re.sub(rf'<{element}([^>]*?)\s*/>', rf'<{element}\1>', html_output, flags=re.IGNORECASE)
-
-        return html_output
+        # Remove self-closing slashes from void elements (HTML5
+        # compliance) in one combined pass instead of one full-document
+        # scan per element name
+        return _VOID_ELEMENT_RE.sub(r'<\1\2>', html_output)
 
     def ensure_document_structure(self, soup):
         """Ensure proper HTML5 document structure"""
@@ -977,7 +1253,9 @@ class PDFProcessor:
         from bs4 import BeautifulSoup
         import re
 
-        soup = BeautifulSoup(html_content, 'html5lib')
+        # Mutation-heavy pass, so BeautifulSoup stays; lxml parses our
+        # own well-formed HTML several times faster than html5lib
+        soup = BeautifulSoup(html_content, 'lxml')
         main = soup.find('main')
 
         if not main:
@@ -1187,31 +1465,11 @@ class PDFProcessor:
             tmp_html_path = tmp_html.name
 
         try:
-            # Use Playwright to render HTML and save as PDF
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                page = browser.new_page()
-
-                # Load the HTML file
-                page.goto(f'file://{tmp_html_path}')
-
-                # Wait for page to be fully rendered
-                page.wait_for_load_state('networkidle')
-
-                # Determine PDF format based on orientation
-                pdf_format = 'Letter' if orientation == 'portrait' else 'Ledger' if orientation == 'landscape' else 'Letter'
-
-                # Generate PDF with browser rendering
-                page.pdf(
-                    path=output_path,
-                    format=pdf_format if orientation in ['portrait', 'landscape'] else None,
-                    landscape=(orientation == 'landscape'),
-                    print_background=True,
-                    prefer_css_page_size=True,  # Respect CSS page size if specified
-                    tagged=True  # Enable PDF tagging for accessibility
-                )
-
-                browser.close()
+            # The browser lives on the render thread, so the render runs
+            # there too; submitting from any caller thread is safe
+            self._render_pool.submit(
+                self._render_pdf, tmp_html_path, output_path, orientation
+            ).result()
 
             print(f"✅ PDF generated successfully using browser rendering")
             return True
@@ -1224,20 +1482,54 @@ class PDFProcessor:
             if os.path.exists(tmp_html_path):
                 os.unlink(tmp_html_path)
 
+    def _render_pdf(self, tmp_html_path, output_path, orientation):
+        """Render one HTML file to PDF; only ever runs on the render thread."""
+        # Reuse the shared browser; each conversion renders in its own
+        # (cheap) context so documents stay isolated
+        browser = self._ensure_browser()
+        context = browser.new_context()
+        try:
+            page = context.new_page()
+
+            # Load the HTML file
+            page.goto(f'file://{tmp_html_path}')
+
+            # Wait for page to be fully rendered
+            page.wait_for_load_state('networkidle')
+
+            # Determine PDF format based on orientation
+            pdf_format = 'Letter' if orientation == 'portrait' else 'Ledger' if orientation == 'landscape' else 'Letter'
+
+            # Generate PDF with browser rendering
+            page.pdf(
+                path=output_path,
+                format=pdf_format if orientation in ['portrait', 'landscape'] else None,
+                landscape=(orientation == 'landscape'),
+                print_background=True,
+                prefer_css_page_size=True,  # Respect CSS page size if specified
+                tagged=True  # Enable PDF tagging for accessibility
+            )
+        finally:
+            context.close()
+
     def detect_page_orientation(self, html_content):
         """
         Detect page orientation (portrait or landscape) from HTML content.
         Returns orientation and page information.
         """
-        soup = BeautifulSoup(html_content, 'html5lib')
-
-        # Find all pdf-page divs to get dimensions
-        pdf_pages = soup.find_all('div', class_='pdf-page')
+        # Read-only query over the full document; Lexbor parses and
+        # selects far faster than building a BeautifulSoup tree
+        if HAS_SELECTOLAX:
+            pdf_pages = LexborHTMLParser(html_content).css('div.pdf-page')
+            page_styles = [node.attributes.get('style') or '' for node in pdf_pages]
+        else:
+            soup = BeautifulSoup(html_content, 'lxml')
+            page_styles = [page.get('style', '')
+                           for page in soup.find_all('div', class_='pdf-page')]
 
-        if pdf_pages:
+        if page_styles:
             # Get dimensions from first page
-            first_page = pdf_pages[0]
-            style = first_page.get('style', '')
+            style = page_styles[0]
 
             # Extract width and height from style attribute
             width_match = re.search(r'width:\s*(\d+(?:\.\d+)?)pt', style)
@@ -1264,7 +1556,7 @@ class PDFProcessor:
                     'height_pt': height_pt,
                     'width_inches': width_inches,
                     'height_inches': height_inches,
-                    'num_pages': len(pdf_pages)
+                    'num_pages': len(page_styles)
                 }
 
                 return orientation, page_info
@@ -1280,8 +1572,9 @@ class PDFProcessor:
 
     def html_to_tagged_pdf(self, html_content, output_path):
         """Convert remediated HTML to properly tagged PDF with accessibility structure"""
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html5lib')
+        # Parse HTML; the input is our own well-formed output, so lxml's
+        # speed wins over html5lib's error recovery
+        soup = BeautifulSoup(html_content, 'lxml')
 
         # Create PDF with ReportLab
         doc = SimpleDocTemplate(
@@ -1491,7 +1784,9 @@ class PDFProcessor:
 
     def apply_specific_fix(self, html_content, issue_type):
         """Apply a specific accessibility fix based on issue type"""
-        soup = BeautifulSoup(html_content, 'html5lib')
+        # Mutation pass, so BeautifulSoup stays; lxml parses our own
+        # well-formed HTML several times faster than html5lib
+        soup = BeautifulSoup(html_content, 'lxml')
 
         if issue_type == 'missing_title':
             # Fix: Add or update document title
@@ -39,6 +39,11 @@ except ImportError:
     sys.exit(1)
 
 
+# Compiled once at import; link fixing calls these per URL
+_URL_PROTOCOL_RE = re.compile(r'https?://')
+_URL_WWW_RE = re.compile(r'^www\.')
+
+
 @dataclass
 class ContentElement:
     """Represents a content element for tagging."""
@@ -244,6 +249,18 @@ class RemediationReport:
 class EnhancedPDFRemediator:
     """Enhanced PDF accessibility remediator with comprehensive tagging."""
 
+    @classmethod
+    def warmup(cls):
+        """Force the module's one-time shared state to load now.
+
+        Batch drivers call this in the parent before starting a forked
+        worker pool so the pikepdf extension module and the compiled
+        patterns are inherited through copy-on-write instead of being
+        re-initialized in every worker. Importing this module is the
+        whole warm-up — pikepdf and the patterns load at import time —
+        so reaching this classmethod means the work is already done.
+        """
+
     def __init__(self, input_path: str, output_path: Optional[str] = None):
         """
         Initialize the enhanced PDF remediator.
@@ -269,6 +286,11 @@ class EnhancedPDFRemediator:
         )
 
         self.images: List[ImageInfo] = []
+        # Page-level XObject index built by analyze_images so later
+        # passes can skip pages with no XObjects outright and resolve
+        # images by name instead of scanning the image list
+        self._pages_with_xobjects: Set[int] = set()
+        self._page_xobject_images: Dict[int, Dict[str, ImageInfo]] = {}
         self.tables: List[TableInfo] = []
         self.links: List[LinkInfo] = []
         self.content_elements: List[ContentElement] = []
@@ -289,12 +311,15 @@ class EnhancedPDFRemediator:
     def analyze_images(self) -> List[ImageInfo]:
         """Analyze all images in the PDF and determine if decorative."""
         images = []
+        self._pages_with_xobjects = set()
+        self._page_xobject_images = {}
 
         try:
             for page_num, page in enumerate(self.pdf.pages, 1):
                 if '/Resources' not in page or '/XObject' not in page.Resources:
                     continue
 
+                self._pages_with_xobjects.add(page_num)
                 xobjects = page.Resources.XObject
 
                 for obj_name in xobjects.keys():
@@ -322,6 +347,8 @@ class EnhancedPDFRemediator:
                             img_info.alt_text = self._generate_alt_text(img_info, page_num)
 
                         images.append(img_info)
+                        self._page_xobject_images.setdefault(
+                            page_num, {})[str(obj_name)] = img_info
 
         except Exception as e:
             print(f"Warning: Error analyzing images: {e}")
@@ -667,6 +694,12 @@ class EnhancedPDFRemediator:
             # Process each page for unmarked content
             for page_num, page in enumerate(self.pdf.pages, 1):
 
+                # Pages the analyze pass saw without any XObjects are
+                # skipped without re-reading their /Resources at all
+                if (self._pages_with_xobjects
+                        and page_num not in self._pages_with_xobjects):
+                    continue
+
                 # Check for unmarked XObjects (images, forms)
                 if '/Resources' in page and '/XObject' in page.Resources:
                     xobjects = page.Resources.XObject
@@ -681,8 +714,8 @@ class EnhancedPDFRemediator:
                             # Check if it's an image
                             if obj.get('/Subtype') == '/Image':
                                 # Check if it's likely decorative (already determined in analyze)
-                                img_info = next((img for img in self.images
-                                               if img.page_number == page_num and img.name == str(obj_name)), None)
+                                img_info = self._page_xobject_images.get(
+                                    page_num, {}).get(str(obj_name))
 
                                 if img_info and img_info.is_decorative:
                                     # Already will be marked by tag_images
@@ -1244,10 +1277,10 @@ class EnhancedPDFRemediator:
     def _generate_link_description(self, url: str) -> str:
         """Generate a descriptive link text from URL."""
         # Remove protocol
-        url = re.sub(r'https?://', '', url)
+        url = _URL_PROTOCOL_RE.sub('', url)
 
         # Remove www
-        url = re.sub(r'^www\.', '', url)
+        url = _URL_WWW_RE.sub('', url)
 
         # Get domain
         domain = url.split('/')[0]